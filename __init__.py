@@ -13,26 +13,67 @@
 # limitations under the License.
 
 import datetime
-import holidays
 import json
-import pytz
+import os
 import re
+import threading
 import time
-from pathlib import Path
-from timezonefinder import TimezoneFinder
-import geocoder
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from functools import partial
+
+# module import is part of the load time, see the load_ms metrics
+_IMPORT_STARTED = time.monotonic()
 
 import mycroft.audio
 from adapt.intent import IntentBuilder
 from mycroft.util.format import (nice_date, nice_duration, nice_time,
-                                 date_time_format)
+                                 date_time_format, join_list)
 from mycroft.messagebus.message import Message
 from mycroft import MycroftSkill, intent_handler
-from mycroft.util.parse import (extract_datetime, fuzzy_match, extract_number,
-                                normalize)
+from mycroft.util.parse import extract_datetime
 from mycroft.util.time import now_utc, to_local, now_local
 from mycroft.skills import resting_screen_handler
 
+from .aliases import get_alias_database
+from .analysis import UtteranceAnalysis
+from .cache import LRUCache, ResolutionCache, SingleFlight
+from .calendar_engine import CalendarEngine, is_leap_year, next_leap_year
+from .display import (DisplaySnapshot, GUISession, mark1_frame_cache,
+                      render_mark1_frame)
+from .gazetteer import get_gazetteer
+from .holiday_index import HolidayIndex, is_known_country
+from .metrics import Metrics
+from .resources import ResourceCache, parse_json_file, parse_regex_file
+from .timezone_lookup import (convert, coordinate_cache, get_finder,
+                              get_fuzzy_index, get_zone, localize,
+                              timezone_at, transition_cache)
+
+RESOLUTION_CACHE_FILE = "timezone_cache.json"
+GEOCODER_TIMEOUT = 3  # seconds
+GEOCODER_DEADLINE = 2  # seconds, see settings "geocoder_deadline"
+LOOKUP_THREADS = 4
+BUILD_INFO_FILE = "/etc/mycroft/build-info.json"
+CLOCK_EVENT = "ClockTick"
+CLOCK_MAX_DRIFT = 5  # seconds
+ALARM_REFRESH_SECONDS = 30
+ALARM_STATE_MAX_AGE = 180
+METRICS_LOG_EVENT = "MetricsLog"
+METRICS_LOG_SECONDS = 600
+PREWARM_EVENT = "Prewarm"
+PREWARM_DELAY = 60  # seconds after the skill is loaded
+FORMAT_CACHE_SIZE = 256
+ANSWER_CACHE_SIZE = 64
+ANALYSIS_CACHE_SIZE = 16
+HOLIDAY_YEARS = 8
+LOW_MEMORY_DIVISOR = 16  # caches shrink by this factor in low memory mode
+MIDNIGHT_EVENT = "Midnight"
+
+# How long answers stay on the display before the clock returns
+DISPLAY_HOLD_EVENT = "DisplayHold"
+TIME_HOLD_SECONDS = 5
+DATE_HOLD_SECONDS = 10
+
 
 def speakable_timezone(tz):
     """Convert timezone to a better speakable version
@@ -51,27 +92,174 @@ def speakable_timezone(tz):
     return " ".join(say)
 
 
+def next_midnight(dt):
+    """The start of the day after dt, in the timezone of dt."""
+    midnight = datetime.datetime.combine(dt.date() + datetime.timedelta(1),
+                                         datetime.time())
+    if hasattr(dt.tzinfo, "localize"):
+        # pytz zones need the offset of that moment
+        return dt.tzinfo.localize(midnight)
+    return midnight.replace(tzinfo=dt.tzinfo)
+
+
+def lower_thread_priority():
+    """Give the calling thread the lowest CPU priority, where possible.
+
+    On Linux setpriority() on a thread id only affects that thread.
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
 class TimeSkill(MycroftSkill):
 
     def __init__(self):
+        self._init_started = time.monotonic()
         super(TimeSkill, self).__init__("TimeSkill")
         self.displayed_time = None
         self.display_tz = None
         self.answering_query = False
         self.default_timezone = None
+        self.resolution_cache = ResolutionCache()
+        self.resources = ResourceCache()
+        self._resource_paths = {}
+        self._holiday_index = None
+        self._holiday_setting = None
+        self._calendar_engine = None
+        self._resting_screen_active = False
+        self._next_tick = None
+        self._calendar_name_cache = {}
+        # Formatted times and dates, keyed by the wall clock minute or day
+        # they show, so an entry is never used once that minute has passed.
+        self.format_cache = LRUCache(FORMAT_CACHE_SIZE)
+        # Answers to date queries, valid until the next midnight
+        self.answer_cache = LRUCache(ANSWER_CACHE_SIZE)
+        self._analyses = LRUCache(ANALYSIS_CACHE_SIZE)
+        self._low_memory = False
+        # the normal bounds of the caches shrunk in low memory mode
+        self._cache_sizes = [(cache, cache.maxsize) for cache in (
+            coordinate_cache, transition_cache, mark1_frame_cache,
+            self.format_cache, self.answer_cache)]
+        self.gui_session = GUISession(self.gui)
+        self._alarm_set = False
+        self._alarm_state_time = float("-inf")
+        self._alarm_query_time = float("-inf")
+        self._hold_started = 0
+        self._lookup_pool = ThreadPoolExecutor(
+            max_workers=LOOKUP_THREADS, thread_name_prefix="TimeSkillLookup")
+        self._lookups_in_flight = SingleFlight()
+        # the geocoder gets its own threads so lookups running on the
+        # lookup pool can't starve it
+        self._remote_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="TimeSkillGeocoder")
+        self.metrics = Metrics()
+        self._rss_at_load = self.metrics.record_memory("at_load")
+        self.metrics.add_cache("coordinates", coordinate_cache.stats)
+        self.metrics.add_cache("zone_transitions", transition_cache.stats)
+        self.metrics.add_cache("resolutions", self.resolution_cache.stats)
+        self.metrics.add_cache("holiday_years",
+                               lambda: self.holiday_index.stats())
+        self.metrics.add_cache("mark1_frames", mark1_frame_cache.stats)
+        self.metrics.add_cache("formatting", self.format_cache.stats)
+        self.metrics.add_cache("date_answers", self.answer_cache.stats)
+        self.metrics.add_cache("business_calendars",
+                               lambda: self.calendar_engine.stats())
 
     def initialize(self):
         date_time_format.cache(self.lang)
+        self.add_event("gui.page.show", self._on_gui_page_show)
+        self.add_event("private.mycroftai.has_alarm.response",
+                       self._on_alarm_state)
+        self.add_event("skill.datetime.times.get", self.handle_times_request)
+        self.add_event("skill.datetime.timezone.get",
+                       self.handle_timezone_request)
+        self.add_event("skill.datetime.metrics.get",
+                       self.handle_metrics_request)
+        self.add_event("configuration.updated", self._on_config_updated)
+        self._load_resolution_cache()
+        self._configure_metrics()
+        self._configure_memory()
+
+        # Redraw the clock at the start of every minute, but only while
+        # something is showing it.
+        self.settings_change_callback = self._on_settings_changed
+        self.add_event("system.clock.synced", self._on_clock_tick)
+        self._schedule_clock_tick()
+        self._schedule_midnight()
+
+        # low memory mode loads everything on demand
+        if (self.settings.get("prewarm_lookups", True) and
+                not self._low_memory):
+            self.schedule_event(self._start_prewarm, PREWARM_DELAY,
+                                name=PREWARM_EVENT)
+
+        init_ms = (time.monotonic() - self._init_started) * 1000
+        self.metrics.record_load("import", _IMPORT_MS)
+        self.metrics.record_load("initialize", init_ms)
+        self.log.info("Skill imported in {:.0f} ms, initialized in {:.0f} "
+                      "ms".format(_IMPORT_MS, init_ms))
+
+    def _start_prewarm(self, message=None):
+        threading.Thread(target=self._prewarm_lookups,
+                         name="TimeSkillPrewarm", daemon=True).start()
+
+    def _prewarm_lookups(self):
+        """Load the lookup data the first queries would otherwise wait for.
+
+        Runs once, some time after boot, on a low priority thread.
+        """
+        lower_thread_priority()
+        started = time.monotonic()
+        try:
+            get_gazetteer()
+            get_alias_database()
+            get_finder()
+            get_fuzzy_index()
+            self.holiday_index.dates(now_local().year)
+            self.get_timezone(self.location_timezone)
+            if self._use_geocoder:
+                import geocoder  # noqa: F401
+        except Exception:
+            self.log.exception("Could not prepare the timezone lookups")
+            return
+        self.log.debug("Lookups prepared in {:.0f} ms".format(
+            (time.monotonic() - started) * 1000))
+        self._log_memory("after_prewarm")
+
+    def _log_memory(self, label):
+        """Log the resident memory, compared to when the skill loaded."""
+        rss = self.metrics.record_memory(label)
+        if rss and self._rss_at_load:
+            self.log.info("Resident memory {}: {:.1f} MB, {:+.1f} MB since "
+                          "load".format(label.replace("_", " "), rss / 1024,
+                                        (rss - self._rss_at_load) / 1024))
+
+    def shutdown(self):
+        self._lookup_pool.shutdown(wait=False)
+        self._remote_pool.shutdown(wait=False)
+        self._save_resolution_cache()
+        super(TimeSkill, self).shutdown()
 
-        # Start a callback that repeats every 10 seconds
-        # TODO: Add mechanism to only start timer when UI setting
-        #       is checked, but this requires a notifier for settings
-        #       updates from the web.
-        now = datetime.datetime.now()
-        callback_time = (datetime.datetime(now.year, now.month, now.day,
-                                           now.hour, now.minute) +
-                         datetime.timedelta(seconds=60))
-        self.schedule_repeating_event(self.update_display, callback_time, 10)
+    @property
+    def _resolution_cache_file(self):
+        return os.path.join(self.file_system.path, RESOLUTION_CACHE_FILE)
+
+    def _load_resolution_cache(self):
+        """Restore timezone lookups saved by a previous run."""
+        if os.path.isfile(self._resolution_cache_file):
+            try:
+                self.resolution_cache.load(self._resolution_cache_file)
+            except Exception:
+                self.log.warning("Ignoring unreadable timezone cache")
+
+    def _save_resolution_cache(self):
+        if self.resolution_cache.dirty:
+            try:
+                self.resolution_cache.save(self._resolution_cache_file)
+            except Exception:
+                self.log.exception("Could not save timezone cache")
 
     # TODO:19.08 Moved to MycroftSkill
     @property
@@ -89,67 +277,135 @@ class TimeSkill(MycroftSkill):
 
     @resting_screen_handler('Time and Date')
     def handle_idle(self, message):
-        self.gui.clear()
+        # asked once here, SkillGUI.connected waits for a bus reply
+        self._resting_screen_active = bool(self.gui.connected)
+        if not self._next_tick:
+            self._schedule_clock_tick()
+        self.gui_session.clear()
         self.log.debug('Activating Time/Date resting page')
-        self.gui['time_string'] = self.get_display_current_time()
-        self.gui['ampm_string'] = ''
-        self.gui['date_string'] = self.get_display_date()
-        self.gui['weekday_string'] = self.get_weekday()
-        self.gui['month_string'] = self.get_month_date()
-        self.gui['year_string'] = self.get_year()
-        self.gui['build_date'] = self.build_info.get('build_date', '')
-        self.gui.show_page('idle.qml')
+        snapshot = self.get_display_snapshot()
+        self.gui_session['time_string'] = snapshot.time_string
+        self.gui_session['ampm_string'] = ''
+        self.gui_session['date_string'] = snapshot.date_string
+        self.gui_session['weekday_string'] = snapshot.weekday_string
+        self.gui_session['month_string'] = snapshot.month_string
+        self.gui_session['year_string'] = snapshot.year_string
+        self.gui_session['build_date'] = self.build_info.get('build_date', '')
+        self.gui_session.show_page('idle.qml')
 
     @property
     def build_info(self):
         """The /etc/mycroft/build-info.json file as a Dict."""
-        data = {}
-        filename = "/etc/mycroft/build-info.json"
-        if (self.config_core["enclosure"].get("development_device")
-            and Path(filename).is_file()):
-            with open(filename, 'r') as build_info:
-                data = json.loads(build_info.read())
-        return data
+        if self.config_core["enclosure"].get("development_device"):
+            return self.resources.load(BUILD_INFO_FILE, parse_json_file, {})
+        return {}
+
+    def _load_resource(self, res_name, res_dirname, parser):
+        """Parse a skill resource file for the current language.
+
+        The file is only parsed again when it changes on disk.
+        """
+        key = (self.lang, res_name, res_dirname)
+        if key not in self._resource_paths:
+            self._resource_paths[key] = self.find_resource(res_name,
+                                                           res_dirname)
+        path = self._resource_paths[key]
+        return self.resources.load(path, parser) if path else None
 
     @property
     def use_24hour(self):
         return self.config_core.get('time_format') == 'full'
 
-    def _get_timezone_from_builtins(self, locale):
-        if "/" not in locale:
-            try:
-                # This handles common city names, like "Dallas" or "Paris"
-                # first get the lat / long.
-                g = geocoder.osm(locale)
-
-                # now look it up
-                tf = TimezoneFinder()
-                timezone = tf.timezone_at(lng=g.lng, lat=g.lat)
-                return pytz.timezone(timezone)
-            except Exception:
-                pass
+    @property
+    def holiday_index(self):
+        """HolidayIndex for the configured country and subdivision."""
+        setting = (self.settings.get("holiday_country"),
+                   self.settings.get("holiday_subdivision"))
+        index = self._holiday_index
+        if not index or self._holiday_setting != setting:
+            country = (setting[0] or "US").strip().upper()
+            if not is_known_country(country):
+                self.log.warning("Unknown holiday country {}, using "
+                                 "US".format(setting[0]))
+                country = "US"
+            index = self._holiday_index = HolidayIndex(
+                country, setting[1] or None, self._cache_size(HOLIDAY_YEARS))
+            self._holiday_setting = setting
+        return index
+
+    @property
+    def calendar_engine(self):
+        """CalendarEngine using the configured holidays as days off."""
+        index = self.holiday_index
+        if (not self._calendar_engine or
+                self._calendar_engine.holiday_index is not index):
+            self._calendar_engine = CalendarEngine(index)
+        return self._calendar_engine
+
+    def _get_timezone_from_gazetteer(self, locale):
+        """Look up common city names, like "Dallas" or "Paris", offline."""
+        place = get_gazetteer().find(locale)
+        if place:
+            return get_zone(place.zone)
+        return None
 
+    def _get_timezone_from_zone_name(self, locale):
+        """This handles codes like "America/Los_Angeles" or "UTC"."""
         try:
-            # This handles codes like "America/Los_Angeles"
-            return pytz.timezone(locale)
+            return get_zone(locale)
         except Exception:
-            pass
-        return None
+            return None
+
+    @property
+    def _geocoder_deadline(self):
+        """The geocoder_deadline setting in seconds, the web settings
+        may hand over an empty string.
+        """
+        try:
+            deadline = float(self.settings.get("geocoder_deadline",
+                                               GEOCODER_DEADLINE))
+        except (TypeError, ValueError):
+            return GEOCODER_DEADLINE
+        return deadline if deadline >= 0 else GEOCODER_DEADLINE
+
+    @property
+    def _use_geocoder(self):
+        return self.settings.get("use_online_geocoder", True)
+
+    def _get_timezone_from_geocoder(self, locale):
+        """This handles cities missing from the offline gazetteer."""
+        try:
+            # first get the lat / long.
+            with self.metrics.timer("geocoder"):
+                import geocoder
+                g = geocoder.osm(locale, timeout=GEOCODER_TIMEOUT)
+
+            # now look it up
+            with self.metrics.timer("timezone_finder"):
+                timezone = timezone_at(g.lat, g.lng)
+            return get_zone(timezone)
+        except Exception:
+            return None
 
     def _get_timezone_from_table(self, locale):
         """Check lookup table for timezones.
 
         This can also be a translation layer.
         E.g. "china = GMT+8"
+        The table holds the timezone.value entries of all languages, IANA
+        names as they are spoken and common abbreviations, see aliases.py.
         """
-        timezones = self.translate_namedvalues("timezone.value")
-        for timezone in timezones:
-            if locale.lower() == timezone.lower():
-                # assumes translation is correct
-                return pytz.timezone(timezones[timezone].strip())
+        timezone = get_alias_database().lookup(locale, self.lang)
+        if timezone:
+            # assumes translation is correct
+            try:
+                return get_zone(timezone)
+            except KeyError:
+                # pytz.UnknownTimeZoneError, a zone newer than pytz
+                return None
         return None
 
-    def _get_timezone_from_fuzzymatch(self, locale):
+    def _get_timezone_from_fuzzymatch(self, locale, interactive=True):
         """Fuzzymatch a location against the pytz timezones.
 
         The pytz timezones consists of
@@ -159,60 +415,175 @@ class TimeSkill(MycroftSkill):
              "Cuba", ..., "EST", ..., "Egypt", ..., "Etc/GMT+3", ...
              "Etc/Zulu", ... "US/Eastern", ... "UTC", ..., "Zulu"]
 
-        These are parsed and compared against the provided location.
+        These are parsed and compared against the provided location using
+        a precomputed index shared by all lookups.
         """
-        target = locale.lower()
-        best = None
-        for name in pytz.all_timezones:
-            # Separate at '/'
-            normalized = name.lower().replace("_", " ").split("/")
-            if len(normalized) == 1:
-                pct = fuzzy_match(normalized[0], target)
-            elif len(normalized) >= 2:
-                # Check for locations like "Sydney"
-                pct1 = fuzzy_match(normalized[1], target)
-                # locations like "Sydney Australia" or "Center North Dakota"
-                pct2 = fuzzy_match(normalized[-2] + " " + normalized[-1],
-                                   target)
-                pct3 = fuzzy_match(normalized[-1] + " " + normalized[-2],
-                                   target)
-                pct = max(pct1, pct2, pct3)
-            if not best or pct >= best[0]:
-                best = (pct, name)
+        return self._confirm_fuzzymatch(self._fuzzymatch(locale),
+                                        interactive)
+
+    def _fuzzymatch(self, locale):
+        with self.metrics.timer("fuzzy_match"):
+            return get_fuzzy_index().best_match(locale.lower())
+
+    def _confirm_fuzzymatch(self, best, interactive):
+        """Accept a (score, zone name) fuzzy match, asking if unsure."""
         if best and best[0] > 0.8:
             # solid choice
-            return pytz.timezone(best[1])
-        elif best and best[0] > 0.3:
+            return get_zone(best[1])
+        elif best and best[0] > 0.3 and interactive:
             say = speakable_timezone(best[1])
             if self.ask_yesno("did.you.mean.timezone",
                               data={"zone_name": say}) == "yes":
-                return pytz.timezone(best[1])
-        else:
-            return None
+                return get_zone(best[1])
+        return None
+
+    def _resolve_timezone(self, locale, interactive):
+        """Run the timezone tiers, in order of priority:
+
+            zone name, gazetteer, geocoder, table, fuzzy match
 
-    def get_timezone(self, locale):
+        The local tiers are evaluated while the geocoder, which needs the
+        network, runs in the background.  The geocoder is given at most
+        geocoder_deadline seconds, an answer arriving later is still
+        cached for the next query.
+
+        Returns:
+            tuple: (timezone, tier name), (None, None) if not found
+        """
+        for tier, lookup in (("zone_name", self._get_timezone_from_zone_name),
+                             ("gazetteer", self._get_timezone_from_gazetteer)):
+            with self.metrics.timer("tier." + tier):
+                timezone = lookup(locale)
+            if timezone:
+                return timezone, tier
+
+        remote = None
+        if "/" not in locale and self._use_geocoder:
+            remote = self._remote_pool.submit(
+                self._get_timezone_from_geocoder, locale)
+
+        with self.metrics.timer("tier.table"):
+            table = self._get_timezone_from_table(locale)
+        fuzzy = None if table else self._fuzzymatch(locale)
+
+        if remote:
+            deadline = self._geocoder_deadline
+            try:
+                with self.metrics.timer("tier.geocoder"):
+                    timezone = remote.result(timeout=deadline)
+                if timezone:
+                    return timezone, "geocoder"
+            except FutureTimeout:
+                self.log.debug("Geocoder missed the deadline for "
+                               "{}".format(locale))
+                remote.add_done_callback(
+                    partial(self._on_late_geocoder, locale, self.lang))
+
+        if table:
+            return table, "table"
+        with self.metrics.timer("tier.fuzzy"):
+            timezone = self._confirm_fuzzymatch(fuzzy, interactive)
+        return (timezone, "fuzzy") if timezone else (None, None)
+
+    def _on_late_geocoder(self, locale, lang, future):
+        # it outranks the tiers that answered meanwhile
+        timezone = future.result()
+        if timezone:
+            self.resolution_cache.put(locale, lang, timezone.zone,
+                                      "geocoder")
+
+    def get_timezone(self, locale, interactive=True):
         """Get the timezone.
 
         This uses a variety of approaches to determine the intended timezone.
         If locale is the user defined locale, we save that timezone and cache it.
+        When interactive is False uncertain matches are not confirmed with
+        the user, they count as not found.
         """
 
         # default timezone exists, so return it.
         if str(self.default_timezone) == locale == self.location_timezone:
             return self.default_timezone
 
+        # answer from earlier lookups, including ones that failed
+        cached = self.resolution_cache.get(locale, self.lang)
+        if cached:
+            return get_zone(cached.zone) if cached.zone else None
+
         # no default timezone has either been requested or saved
-        timezone = self._get_timezone_from_builtins(locale)
-        if not timezone:
-            timezone = self._get_timezone_from_table(locale)
-        if not timezone:
-            timezone = self._get_timezone_from_fuzzymatch(locale)
+        timezone, tier = self._resolve_timezone(locale, interactive)
+        if timezone:
+            self.resolution_cache.put(locale, self.lang, timezone.zone, tier)
+        elif interactive:
+            self.resolution_cache.put(locale, self.lang, None)
 
         # if the current request is our default timezone, save it.         
         if locale == self.location_timezone:
             self.default_timezone = timezone
         return timezone
 
+    def get_timezones(self, locations):
+        """Resolve several locations concurrently.
+
+        Lookups run on a small thread pool, so the total time is about
+        that of the slowest location.  Uncertain fuzzy matches are not
+        confirmed with the user.
+
+        Returns:
+            Dict: {location: timezone}, None for locations not found
+        """
+        futures = {location: self._lookup_pool.submit(
+                       self._get_timezone_shared, location)
+                   for location in set(locations)}
+        return {location: futures[location].result()
+                for location in locations}
+
+    def _get_timezone_shared(self, location):
+        """Non-interactive get_timezone, concurrent calls for the same
+        location wait for a single lookup.
+        """
+        key = ResolutionCache.key(location, self.lang)
+        return self._lookups_in_flight.run(key, self.get_timezone,
+                                           location, False)
+
+    def handle_timezone_request(self, message):
+        """Answer another skill's request for a location's timezone.
+
+        The lookup runs on the lookup pool so the bus isn't blocked.
+        """
+        self._lookup_pool.submit(self._answer_timezone_request, message)
+
+    def _answer_timezone_request(self, message):
+        location = message.data.get("location", "")
+        timezone = self._get_timezone_shared(location) if location else None
+        data = {"location": location, "timezone": None,
+                "utc_offset": None, "local_time": None}
+        if timezone:
+            local = convert(now_utc(), timezone)
+            data.update({
+                "timezone": timezone.zone,
+                "utc_offset": int(local.utcoffset().total_seconds()),
+                "local_time": local.isoformat()})
+        self.bus.emit(message.reply("skill.datetime.timezone", data))
+
+    def _split_locations(self, location):
+        """Split "London, Tokyo and Denver" into its locations.
+
+        Only lists joined by the "and" word are split, a bare comma is
+        more likely a qualifier as in "Springfield, Illinois".  Languages
+        without the dialogs for several times are not split.
+        """
+        if not location:
+            return []
+        if not (self.find_resource("time.location.dialog", "dialog") and
+                self.find_resource("and.dialog", "dialog")):
+            return [location]
+        conjunction = r"\s+{}\s+".format(re.escape(self.translate("and")))
+        if not re.search(conjunction, location):
+            return [location]
+        parts = re.split(r"\s*,\s*|" + conjunction, location)
+        return [part.strip() for part in parts if part.strip()]
+
     def get_local_datetime(self, location, dtUTC=None):
         if not dtUTC:
             dtUTC = now_utc()
@@ -228,15 +599,35 @@ class TimeSkill(MycroftSkill):
             self.speak_dialog("time.tz.not.found", {"location": location})
             return None
 
-        return dtUTC.astimezone(tz)
+        return convert(dtUTC, tz)
+
+    def _formatted(self, key, func, *args, **kwargs):
+        """Get func(*args, **kwargs) from the format cache.
+
+        The key must hold everything the result depends on.
+        """
+        value = self.format_cache.get(key)
+        if value is None:
+            value = func(*args, **kwargs)
+            self.format_cache.put(key, value)
+        return value
+
+    def _nice_date(self, day, lang=None):
+        """nice_date() of a day, without a reference date."""
+        lang = lang or self.lang
+        return self._formatted(("nice_date", lang, day.year, day.month,
+                                day.day), nice_date, day, lang=lang)
 
     def get_display_date(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        if self.config_core.get('date_format') == 'MDY':
-            return day.strftime("%-m/%-d/%Y")
+        date_format = self.config_core.get('date_format')
+        if date_format == 'MDY':
+            pattern = "%-m/%-d/%Y"
         else:
-            return day.strftime("%Y/%-d/%-m")
+            pattern = "%Y/%-d/%-m"
+        return self._formatted(("display_date", date_format, day.year,
+                                day.month, day.day), day.strftime, pattern)
 
     def get_display_current_time(self, location=None, dtUTC=None):
         # Get a formatted digital clock time based on the user preferences
@@ -244,8 +635,29 @@ class TimeSkill(MycroftSkill):
         if not dt:
             return None
 
-        return nice_time(dt, self.lang, speech=False,
-                         use_24hour=self.use_24hour)
+        return self._format_display_time(dt)
+
+    def _format_display_time(self, dt):
+        # nice_time only looks at the hour and minute
+        return self._formatted(
+            ("display_time", self.lang, self.use_24hour, dt.hour, dt.minute),
+            nice_time, dt, self.lang, speech=False,
+            use_24hour=self.use_24hour)
+
+    def get_display_snapshot(self, location=None, dtUTC=None):
+        """Format everything the displays show from one clock reading.
+
+        Returns:
+            DisplaySnapshot: None if the timezone can't be found
+        """
+        day = self.get_local_datetime(location, dtUTC)
+        if not day:
+            return None
+        return DisplaySnapshot(day, self._format_display_time(day),
+                               self.get_display_date(day),
+                               self.get_weekday(day),
+                               self.get_month_date(day),
+                               self.get_year(day))
 
     def get_spoken_current_time(self, location=None,
                                 dtUTC=None, force_ampm=False):
@@ -257,108 +669,205 @@ class TimeSkill(MycroftSkill):
         # speak AM/PM when talking about somewhere else
         say_am_pm = bool(location) or force_ampm
 
-        s = nice_time(dt, self.lang, speech=True,
-                      use_24hour=self.use_24hour, use_ampm=say_am_pm)
+        s = self._formatted(
+            ("spoken_time", self.lang, self.use_24hour, say_am_pm,
+             dt.hour, dt.minute),
+            nice_time, dt, self.lang, speech=True,
+            use_24hour=self.use_24hour, use_ampm=say_am_pm)
         # HACK: Mimic 2 has a bug with saying "AM".  Work around it for now.
         if say_am_pm:
             s = s.replace("AM", "A.M.")
 
         return s
 
-    def display(self, display_time):
+    def display(self, display_time, date_string=None):
         if display_time:
             if self.platform == "mycroft_mark_1":
                 self.display_mark1(display_time)
-            self.display_gui(display_time)
+            self.display_gui(display_time, date_string)
 
     def display_mark1(self, display_time):
-        # Map characters to the display encoding for a Mark 1
-        # (4x8 except colon, which is 2x8)
-        code_dict = {
-            ':': 'CIICAA',
-            '0': 'EIMHEEMHAA',
-            '1': 'EIIEMHAEAA',
-            '2': 'EIEHEFMFAA',
-            '3': 'EIEFEFMHAA',
-            '4': 'EIMBABMHAA',
-            '5': 'EIMFEFEHAA',
-            '6': 'EIMHEFEHAA',
-            '7': 'EIEAEAMHAA',
-            '8': 'EIMHEFMHAA',
-            '9': 'EIMBEBMHAA',
-        }
-
-        # clear screen (draw two blank sections, numbers cover rest)
-        if len(display_time) == 4:
-            # for 4-character times, 9x8 blank
-            self.enclosure.mouth_display(img_code="JIAAAAAAAAAAAAAAAAAA",
-                                         refresh=False)
-            self.enclosure.mouth_display(img_code="JIAAAAAAAAAAAAAAAAAA",
-                                         x=22, refresh=False)
-        else:
-            # for 5-character times, 7x8 blank
-            self.enclosure.mouth_display(img_code="HIAAAAAAAAAAAAAA",
-                                         refresh=False)
-            self.enclosure.mouth_display(img_code="HIAAAAAAAAAAAAAA",
-                                         x=24, refresh=False)
-
-        # draw the time, centered on display
-        xoffset = (32 - (4*(len(display_time))-2)) / 2
-        for c in display_time:
-            if c in code_dict:
-                self.enclosure.mouth_display(img_code=code_dict[c],
-                                             x=xoffset, refresh=False)
-                if c == ":":
-                    xoffset += 2  # colon is 1 pixels + a space
-                else:
-                    xoffset += 4  # digits are 3 pixels + a space
-
-        if self._is_alarm_set():
-            # Show a dot in the upper-left
-            self.enclosure.mouth_display(img_code="CIAACA", x=29,
-                                         refresh=False)
-        else:
-            self.enclosure.mouth_display(img_code="CIAAAA", x=29,
-                                         refresh=False)
+        # The whole 32x8 faceplate in a single message, which also blanks
+        # whatever was shown before.
+        frame = render_mark1_frame(display_time, self._is_alarm_set())
+        self.enclosure.mouth_display(img_code=frame, refresh=False)
 
     def _is_alarm_set(self):
-        """Query the alarm skill if an alarm is set."""
-        query = Message("private.mycroftai.has_alarm")
-        msg = self.bus.wait_for_response(query)
-        return msg and msg.data.get("active_alarms", 0) > 0
+        """Check the last alarm state reported by the alarm skill.
 
-    def display_gui(self, display_time):
+        This never waits on the bus.  The state is refreshed on every
+        clock tick, and is treated as "no alarm" once the alarm skill has
+        not answered for a while.
+        """
+        age = time.monotonic() - self._alarm_state_time
+        if age > ALARM_REFRESH_SECONDS:
+            self._refresh_alarm_state()
+        if age > ALARM_STATE_MAX_AGE:
+            return False
+        return self._alarm_set
+
+    def _refresh_alarm_state(self):
+        """Ask the alarm skill for its state, the answer arrives later."""
+        now = time.monotonic()
+        if now - self._alarm_query_time >= ALARM_REFRESH_SECONDS:
+            self._alarm_query_time = now
+            self.bus.emit(Message("private.mycroftai.has_alarm"))
+
+    def _on_alarm_state(self, message):
+        self._alarm_set = message.data.get("active_alarms", 0) > 0
+        self._alarm_state_time = time.monotonic()
+
+    def display_gui(self, display_time, date_string=None):
         """ Display time on the Mycroft GUI. """
-        self.gui.clear()
-        self.gui['time_string'] = display_time
-        self.gui['ampm_string'] = ''
-        self.gui['date_string'] = self.get_display_date()
-        self.gui.show_page('time.qml')
+        self.gui_session.clear()
+        self.gui_session['time_string'] = display_time
+        self.gui_session['ampm_string'] = ''
+        self.gui_session['date_string'] = (date_string or
+                                           self.get_display_date())
+        self.gui_session.show_page('time.qml')
+
+    def _on_gui_page_show(self, message):
+        # another skill took over the GUI, our page must be shown again
+        if message.data.get("__from") != self.skill_id:
+            self.gui_session.invalidate()
+            if self._resting_screen_active:
+                # until handle_idle shows the resting screen again
+                self._resting_screen_active = False
+                self._schedule_clock_tick()
 
     def _is_display_idle(self):
         # check if the display is being used by another skill right now
         # or _get_active() == "TimeSkill"
         return self.enclosure.display_manager.get_active() == ''
 
+    @property
+    def _display_wanted(self):
+        """True when the clock is shown on the faceplate or resting screen.
+
+        The resting screen only counts if a GUI was connected when it was
+        activated.
+        """
+        return bool(self.settings.get("show_time", False) or
+                    self._resting_screen_active)
+
+    def _schedule_clock_tick(self):
+        """Update the display at the start of the next local minute.
+
+        The clock stops when nothing is showing it.
+        """
+        self.cancel_scheduled_event(CLOCK_EVENT)
+        if not self._display_wanted:
+            self._next_tick = None
+            return
+        now = datetime.datetime.now()
+        self._next_tick = (now.replace(second=0, microsecond=0) +
+                           datetime.timedelta(minutes=1))
+        self.schedule_event(self._on_clock_tick, self._next_tick,
+                            name=CLOCK_EVENT)
+
+    def _on_clock_tick(self, message=None):
+        # Ticks arrive late after a suspend and early or late when the
+        # system clock is changed, either way redraw and realign.
+        if self._next_tick:
+            drift = datetime.datetime.now() - self._next_tick
+            if abs(drift.total_seconds()) > CLOCK_MAX_DRIFT:
+                self.log.debug("Clock tick off by {}, catching up".format(
+                    drift))
+        self.update_display()
+        self._schedule_clock_tick()
+        if self.platform == "mycroft_mark_1":
+            # fresh alarm state for the next frame
+            self._refresh_alarm_state()
+        self.log.debug("GUI messages in the last minute: {}".format(
+            self.gui_session.messages_per_minute()))
+
+    def _schedule_midnight(self):
+        """Forget the answers of the day when the next local day starts."""
+        self.cancel_scheduled_event(MIDNIGHT_EVENT)
+        self.schedule_event(self._on_midnight, next_midnight(now_local()),
+                            name=MIDNIGHT_EVENT)
+
+    def _on_midnight(self, message=None):
+        self.answer_cache.clear()
+        self._schedule_midnight()
+
+    def _on_config_updated(self, message=None):
+        # the location, and with it the local timezone, may have changed
+        self.format_cache.clear()
+        self.answer_cache.clear()
+        self._schedule_midnight()
+
+    def _on_settings_changed(self):
+        self.format_cache.clear()
+        self.answer_cache.clear()
+        # also erases the faceplate clock when show_time was turned off
+        self.update_display()
+        self._schedule_clock_tick()
+        self._configure_metrics()
+        self._configure_memory()
+
+    def _cache_size(self, size):
+        if self._low_memory:
+            return max(2, size // LOW_MEMORY_DIVISOR)
+        return size
+
+    def _configure_memory(self):
+        """Apply the low_memory setting.
+
+        Low memory mode shrinks the caches and keeps fewer holiday years.
+        The timezone polygons are always read from memory-mapped files.
+        """
+        low_memory = bool(self.settings.get("low_memory", False))
+        if low_memory == self._low_memory:
+            return
+        self._low_memory = low_memory
+        for cache, size in self._cache_sizes:
+            cache.resize(self._cache_size(size))
+        self._holiday_index = None
+        self._log_memory("low_memory_on" if low_memory
+                         else "low_memory_off")
+
+    def _configure_metrics(self):
+        self.metrics.enabled = bool(self.settings.get("collect_metrics",
+                                                      False))
+        self.cancel_scheduled_event(METRICS_LOG_EVENT)
+        if self.metrics.enabled:
+            self.schedule_repeating_event(self._log_metrics, None,
+                                          METRICS_LOG_SECONDS,
+                                          name=METRICS_LOG_EVENT)
+
+    def _log_metrics(self, message=None):
+        self.log.debug("Metrics: {}".format(
+            json.dumps(self.metrics.report())))
+
+    def handle_metrics_request(self, message):
+        """Reply with the collected timings and cache hit ratios."""
+        self.bus.emit(message.reply("skill.datetime.metrics",
+                                    self.metrics.report()))
+
     def update_display(self, force=False):
         # Don't show idle time when answering a query to prevent
         # overwriting the displayed value.
         if self.answering_query:
             return
 
-        self.gui['time_string'] = self.get_display_current_time()
-        self.gui['date_string'] = self.get_display_date()
-        self.gui['ampm_string'] = ''  # TODO
-        self.gui['weekday_string'] = self.get_weekday()
-        self.gui['month_string'] = self.get_month_date()
+        snapshot = self.get_display_snapshot()
+        if not snapshot:
+            return
+
+        self.gui_session['time_string'] = snapshot.time_string
+        self.gui_session['date_string'] = snapshot.date_string
+        self.gui_session['ampm_string'] = ''  # TODO
+        self.gui_session['weekday_string'] = snapshot.weekday_string
+        self.gui_session['month_string'] = snapshot.month_string
 
         if self.settings.get("show_time", False):
             # user requested display of time while idle
             if (force is True) or self._is_display_idle():
-                current_time = self.get_display_current_time()
+                current_time = snapshot.time_string
                 if self.displayed_time != current_time:
                     self.displayed_time = current_time
-                    self.display(current_time)
+                    self.display(current_time, snapshot.date_string)
                     # return mouth to 'idle'
                     self.enclosure.display_manager.remove_active()
             else:
@@ -373,22 +882,68 @@ class TimeSkill(MycroftSkill):
                     self.enclosure.display_manager.remove_active()
                 self.displayed_time = None
 
+    def _hold_display(self, seconds, reset_mouth=True):
+        """Keep an answer on the display, then return to the idle clock.
+
+        The restore is a scheduled event so the intent handler returns
+        right away.  A newer query replaces a restore still pending.
+        """
+        self.answering_query = True
+        self._hold_started = time.monotonic()
+        self.cancel_scheduled_event(DISPLAY_HOLD_EVENT)
+        self.schedule_event(self._release_display, seconds,
+                            data={"reset_mouth": reset_mouth},
+                            name=DISPLAY_HOLD_EVENT)
+
+    def _release_display(self, message):
+        if mycroft.audio.is_speaking():
+            # keep showing the answer until it has been spoken
+            self.cancel_scheduled_event(DISPLAY_HOLD_EVENT)
+            self.schedule_event(self._release_display, 1, data=message.data,
+                                name=DISPLAY_HOLD_EVENT)
+            return
+
+        if message.data.get("reset_mouth", True):
+            self.enclosure.mouth_reset()
+            self.enclosure.activate_mouth_events()
+        self.answering_query = False
+        self.displayed_time = None
+        self.metrics.record("display_hold",
+                            (time.monotonic() - self._hold_started) * 1000)
+        if self._display_wanted:
+            # redraw the clock now rather than at the next minute
+            self.update_display()
+
+    def _analyze(self, message):
+        """The UtteranceAnalysis of a message's utterance.
+
+        Analyses are shared for the rest of the minute, relative times
+        like "in 5 hours" are parsed from the start of it.
+        """
+        utt = message.data.get('utterance', "")
+        key = (utt, self.lang, int(time.time() // 60))
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = UtteranceAnalysis(utt, self)
+            self._analyses.put(key, analysis)
+        return analysis
+
+    def _extract_datetime(self, text, anchor_date=None, lang=None):
+        with self.metrics.timer("extract_datetime"):
+            return extract_datetime(text, anchor_date, lang or self.lang)
+
     def _extract_location(self, utt):
         # if "Location" in message.data:
         #     return message.data["Location"]
-        rx_file = self.find_resource('location.rx', 'regex')
-        if rx_file:
-            with open(rx_file) as f:
-                for pat in f.read().splitlines():
-                    pat = pat.strip()
-                    if pat and pat[0] == "#":
-                        continue
-                    res = re.search(pat, utt)
-                    if res:
-                        try:
-                            return res.group("Location")
-                        except IndexError:
-                            pass
+        patterns = self._load_resource('location.rx', 'regex',
+                                       parse_regex_file) or []
+        for pat in patterns:
+            res = pat.search(utt)
+            if res:
+                try:
+                    return res.group("Location")
+                except IndexError:
+                    pass
         return None
 
     ######################################################################
@@ -396,9 +951,16 @@ class TimeSkill(MycroftSkill):
 
     @intent_handler(IntentBuilder("").require("Query").require("Time").
                     optionally("Location"))
-    def handle_query_time(self, message):
-        utt = message.data.get('utterance', "")
-        location = self._extract_location(utt)
+    def handle_query_time(self, message, analysis=None):
+        analysis = analysis or self._analyze(message)
+        location = analysis.location
+        locations = self._split_locations(location)
+        timezones = (self._resolve_parts(location, locations)
+                     if len(locations) > 1 else None)
+        if timezones:
+            self._speak_times(locations, timezones)
+            return
+
         current_time = self.get_spoken_current_time(location)
         if not current_time:
             return
@@ -410,29 +972,92 @@ class TimeSkill(MycroftSkill):
         self.answering_query = True
         self.enclosure.deactivate_mouth_events()
         self.display(self.get_display_current_time(location))
-        time.sleep(5)
-        mycroft.audio.wait_while_speaking()
-        self.enclosure.mouth_reset()
-        self.enclosure.activate_mouth_events()
-        self.answering_query = False
-        self.displayed_time = None
+        self._hold_display(TIME_HOLD_SECONDS)
+
+    def _get_timezone_offline(self, locale):
+        """Resolve a location from earlier lookups and the offline tiers.
+
+        Unlike the gazetteer tier the whole name must match, "London,
+        Tokyo" is not London.  No network or fuzzy matching is used.
+        """
+        cached = self.resolution_cache.get(locale, self.lang)
+        if cached and cached.zone:
+            return get_zone(cached.zone)
+        place = get_gazetteer().get(locale)
+        if place:
+            return get_zone(place.zone)
+        return (self._get_timezone_from_zone_name(locale) or
+                self._get_timezone_from_table(locale))
+
+    def _resolve_parts(self, location, locations):
+        """Resolve a location split into locations, if it isn't one place.
+
+        The whole phrase is looked up with all tiers along with its
+        parts, e.g. "Trinidad and Tobago" or "Springfield, Illinois" is
+        one place.
+
+        Returns:
+            Dict: {location: timezone} of the parts, None if the whole
+                  phrase was found or none of the parts was
+        """
+        if self._get_timezone_offline(location):
+            return None
+        timezones = self.get_timezones([location] + locations)
+        if timezones[location] or not any(timezones[part]
+                                          for part in locations):
+            return None
+        return timezones
+
+    def _speak_times(self, locations, timezones):
+        """Speak the current time in several locations at once.
+
+        The locations that can't be found are named, once the times of
+        the others have been spoken.
+        """
+        now = now_utc()
+        times = [self.translate("time.location", {
+                    "time": self.get_spoken_current_time(location, now),
+                    "location": location})
+                 for location in locations if timezones[location]]
+        if times:
+            self.speak_dialog("time.current", {
+                "time": join_list(times, self.translate("and"))})
+        for location in locations:
+            if not timezones[location]:
+                self.speak_dialog("time.tz.not.found",
+                                  {"location": location})
+
+    def handle_times_request(self, message):
+        """Reply with the current time in a list of locations."""
+        locations = message.data.get("locations", [])
+        timezones = self.get_timezones(locations)
+        now = now_utc()
+        times = []
+        for location in locations:
+            timezone = timezones[location]
+            local = convert(now, timezone) if timezone else None
+            times.append({
+                "location": location,
+                "timezone": timezone.zone if timezone else None,
+                "time": local.isoformat() if local else None,
+                "display": (self._format_display_time(local)
+                            if local else None)})
+        self.bus.emit(message.reply("skill.datetime.times",
+                                    {"times": times}))
 
     @intent_handler("what.time.is.it.intent")
     def handle_current_time_simple(self, message):
         self.handle_query_time(message)
 
     @intent_handler("what.time.will.it.be.intent")
-    def handle_query_future_time(self, message):
-        utt = normalize(message.data.get('utterance', "").lower())
-        extract = extract_datetime(utt)
-        dt = None
-        if extract:
-            dt, utt = extract
-        else:
-            self.handle_query_time(message)
+    def handle_query_future_time(self, message, analysis=None):
+        analysis = analysis or self._analyze(message)
+        if not analysis.future_extract:
+            self.handle_query_time(message, analysis)
             return
 
-        location = self._extract_location(utt)
+        dt = analysis.future_extract[0]
+        location = analysis.future_location
         future_time = self.get_spoken_current_time(location, dt, True)
         if not future_time:
             return
@@ -444,12 +1069,7 @@ class TimeSkill(MycroftSkill):
         self.answering_query = True
         self.enclosure.deactivate_mouth_events()
         self.display(self.get_display_current_time(location, dt))
-        time.sleep(5)
-        mycroft.audio.wait_while_speaking()
-        self.enclosure.mouth_reset()
-        self.enclosure.activate_mouth_events()
-        self.answering_query = False
-        self.displayed_time = None
+        self._hold_display(TIME_HOLD_SECONDS)
 
     @intent_handler(IntentBuilder("").optionally("Query").
                     require("Time").require("Future").optionally("Location"))
@@ -460,8 +1080,9 @@ class TimeSkill(MycroftSkill):
                     optionally("Location"))
     def handle_show_time(self, message):
         self.display_tz = None
-        utt = message.data.get('utterance', "")
-        location = self._extract_location(utt)
+        self.format_cache.clear()
+        self.answer_cache.clear()
+        location = self._analyze(message).location
         if location:
             tz = self.get_timezone(location)
             if not tz:
@@ -475,82 +1096,98 @@ class TimeSkill(MycroftSkill):
         # show time immediately
         self.settings["show_time"] = True
         self.update_display(True)
+        self._schedule_clock_tick()
 
     ######################################################################
     # Date queries
 
-    def handle_query_date(self, message, response_type="simple"):
+    def handle_query_date(self, message, response_type="simple",
+                          analysis=None):
         utt = message.data.get('utterance', "").lower()
-        try:
-            extract = extract_datetime(utt)
-        except Exception:
+        key = (self.lang, response_type, " ".join(utt.split()))
+        answer = self.answer_cache.get(key)
+        if answer and now_utc() < answer[0]:
+            expires, dialog, data, location, day = answer
+        else:
+            answer = self._answer_date(analysis or self._analyze(message),
+                                       response_type)
+            if not answer:
+                return
+            self.answer_cache.put(key, answer)
+            expires, dialog, data, location, day = answer
+
+        # speak it
+        self.speak_dialog(dialog, data)
+
+        # and briefly show the date
+        self.answering_query = True
+        self.show_date(location, day=day)
+        self._hold_display(DATE_HOLD_SECONDS,
+                           reset_mouth=self.platform == "mycroft_mark_1")
+
+    def _answer_date(self, analysis, response_type):
+        """Work out the answer to a date query.
+
+        Returns:
+            tuple: (expires, dialog, dialog data, location, day), expires
+                   is the UTC time the answer is no longer valid, at the
+                   next midnight, or the next minute for answers relative
+                   to the current time.  None if the query couldn't be
+                   answered.
+        """
+        extract = analysis.extract
+        if analysis.date_error:
             self.speak_dialog('date.not.found')
-            return
+            return None
         day = extract[0] if extract else now_local()
 
         # check if a Holiday was requested, e.g. "What day is Christmas?"
-        year = extract_number(utt)
-        if not year or year < 1500 or year > 3000:  # filter out non-years
-            year = day.year
-        all_holidays = {}
-        # TODO: How to pick a location for holidays?
-        for st in holidays.US.STATES:
-            holiday_dict = holidays.US(years=[year], state=st)
-            for d, name in holiday_dict.items():
-                if name not in all_holidays:
-                    all_holidays[name] = d
-        for name in all_holidays:
-            d = all_holidays[name]
-            # Uncomment to display all holidays in the database
-            # self.log.info("Day, name: " +str(d) + " " + str(name))
-            if name.replace(" Day", "").lower() in utt:
-                day = d
-                break
-
-        location = self._extract_location(utt)
+        year = analysis.year or day.year
+        with self.metrics.timer("holidays"):
+            holiday = self.holiday_index.find(analysis.text, year)
+        if holiday:
+            day = datetime.datetime.combine(holiday[1], datetime.time(0))
+
+        location = analysis.date_location
         today = to_local(now_utc())
+        expires = next_midnight(today)
+        if extract and extract[0].time() != datetime.time(0):
+            # e.g. "in 3 hours", the answer depends on the time of day
+            expires = (now_utc().replace(second=0, microsecond=0) +
+                       datetime.timedelta(minutes=1))
         if location:
-            # TODO: Timezone math!
-            if (day.year == today.year and day.month == today.month
-                    and day.day == today.day):
-                day = now_utc()  # for questions ~ "what is the day in sydney"
-            day = self.get_local_datetime(location, dtUTC=day)
-        if not day:
-            return  # failed in timezone lookup
-
-        speak_date = nice_date(day, lang=self.lang)
-        # speak it
-        if response_type == "simple":
-            self.speak_dialog("date", {"date": speak_date})
-        elif response_type == "relative":
-            # remove time data to get clean dates
-            day_date = day.replace(hour=0, minute=0,
-                                   second=0, microsecond=0)
-            today_date = today.replace(hour=0, minute=0,
-                                       second=0, microsecond=0)
-            num_days = (day_date - today_date).days
+            tz = self.get_timezone(location)
+            if not tz:
+                self.speak_dialog("time.tz.not.found", {"location": location})
+                return None
+            if day.date() == today.date():
+                # for questions ~ "what is the day in sydney"
+                day = convert(now_utc(), tz)
+            elif day.time() == datetime.time(0):
+                # a calendar date, e.g. "christmas", is the same date
+                # there, shifting its local midnight could change the day
+                day = localize(day.replace(tzinfo=None), tz)
+            else:
+                day = convert(day, tz)
+            # the date there changes at its own midnight
+            expires = min(expires, next_midnight(convert(now_utc(), tz)))
+
+        speak_date = self._nice_date(day)
+        if response_type == "relative":
+            # compare calendar dates, day and today can be in other zones
+            num_days = (day.date() - today.date()).days
             if num_days >= 0:
                 speak_num_days = nice_duration(num_days * 86400)
-                self.speak_dialog("date.relative.future",
-                                  {"date": speak_date,
-                                   "num_days": speak_num_days})
+                return (expires, "date.relative.future",
+                        {"date": speak_date, "num_days": speak_num_days},
+                        location, day)
             else:
                 # if in the past, make positive before getting duration
                 speak_num_days = nice_duration(num_days * -86400)
-                self.speak_dialog("date.relative.past",
-                                  {"date": speak_date,
-                                   "num_days": speak_num_days})
-
-        # and briefly show the date
-        self.answering_query = True
-        self.show_date(location, day=day)
-        time.sleep(10)
-        mycroft.audio.wait_while_speaking()
-        if self.platform == "mycroft_mark_1":
-            self.enclosure.mouth_reset()
-            self.enclosure.activate_mouth_events()
-        self.answering_query = False
-        self.displayed_time = None
+                return (expires, "date.relative.past",
+                        {"date": speak_date, "num_days": speak_num_days},
+                        location, day)
+        return expires, "date", {"date": speak_date}, location, day
 
     @intent_handler(IntentBuilder("").require("Query").require("Date").
                     optionally("Location"))
@@ -564,27 +1201,23 @@ class TimeSkill(MycroftSkill):
     @intent_handler(IntentBuilder("").require("Query").require("RelativeDay")
                                      .optionally("Date"))
     def handle_query_relative_date(self, message):
-        if self.voc_match(message.data.get('utterance', ""), 'Today'):
-            self.handle_query_date(message, response_type="simple")
+        analysis = self._analyze(message)
+        if analysis.today:
+            self.handle_query_date(message, "simple", analysis)
         else:
-            self.handle_query_date(message, response_type="relative")
+            self.handle_query_date(message, "relative", analysis)
 
     @intent_handler(IntentBuilder("").require("RelativeDay").require("Date"))
     def handle_query_relative_date_alt(self, message):
-        if self.voc_match(message.data.get('utterance', ""), 'Today'):
-            self.handle_query_date(message, response_type="simple")
+        analysis = self._analyze(message)
+        if analysis.today:
+            self.handle_query_date(message, "simple", analysis)
         else:
-            self.handle_query_date(message, response_type="relative")
+            self.handle_query_date(message, "relative", analysis)
 
     @intent_handler("date.future.weekend.intent")
     def handle_date_future_weekend(self, message):
-        # Strip year off nice_date as request is inherently close
-        # Don't pass `now` to `nice_date` as a
-        # request on Friday will return "tomorrow"
-        saturday_date = ', '.join(nice_date(extract_datetime(
-                        'this saturday', None, 'en-us')[0]).split(', ')[:2])
-        sunday_date = ', '.join(nice_date(extract_datetime(
-                      'this sunday', None, 'en-us')[0]).split(', ')[:2])
+        saturday_date, sunday_date = self._weekend_dates("this")
         self.speak_dialog('date.future.weekend', {
             'saturday_date': saturday_date,
             'sunday_date': sunday_date
@@ -592,25 +1225,101 @@ class TimeSkill(MycroftSkill):
 
     @intent_handler("date.last.weekend.intent")
     def handle_date_last_weekend(self, message):
-        # Strip year off nice_date as request is inherently close
-        # Don't pass `now` to `nice_date` as a
-        # request on Monday will return "yesterday"
-        saturday_date = ', '.join(nice_date(extract_datetime(
-                        'last saturday', None, 'en-us')[0]).split(', ')[:2])
-        sunday_date = ', '.join(nice_date(extract_datetime(
-                      'last sunday', None, 'en-us')[0]).split(', ')[:2])
+        saturday_date, sunday_date = self._weekend_dates("last")
         self.speak_dialog('date.last.weekend', {
             'saturday_date': saturday_date,
             'sunday_date': sunday_date
         })
 
+    def _weekend_dates(self, which):
+        """Spoken dates of "this" or "last" weekend, the same all day."""
+        today = now_local()
+        return self._formatted(("weekend", which, today.year, today.month,
+                                today.day), self._format_weekend, which)
+
+    def _format_weekend(self, which):
+        # Strip year off nice_date as request is inherently close
+        # Don't pass `now` to `nice_date` as a
+        # request on Friday will return "tomorrow"
+        dates = []
+        for day in ("saturday", "sunday"):
+            extract = self._extract_datetime(which + " " + day, None,
+                                             'en-us')
+            dates.append(', '.join(nice_date(extract[0]).split(', ')[:2]))
+        return tuple(dates)
+
     @intent_handler(IntentBuilder("").require("Query").require("LeapYear"))
     def handle_query_next_leap_year(self, message):
         now = datetime.datetime.now()
         leap_date = datetime.datetime(now.year, 2, 28)
         year = now.year if now <= leap_date else now.year + 1
-        next_leap_year = self.get_next_leap_year(year)
-        self.speak_dialog('next.leap.year', {'year': next_leap_year})
+        self.speak_dialog('next.leap.year',
+                          {'year': self.get_next_leap_year(year)})
+
+    @intent_handler("working.days.until.intent")
+    def handle_query_working_days(self, message):
+        target = self._extract_target_date(message.data.get("date", ""))
+        if not target:
+            self.speak_dialog('date.not.found')
+            return
+        count = self.calendar_engine.working_days(now_local().date(), target)
+        self.speak_dialog('working.days.until', {
+            'count': abs(count),
+            'date': self._nice_date(target)})
+
+    @intent_handler("weekdays.until.intent")
+    def handle_query_weekdays(self, message):
+        said = message.data.get("weekday", "")
+        weekday = self._find_weekday(said)
+        target = self._extract_target_date(message.data.get("date", ""))
+        if weekday is None or not target:
+            self.speak_dialog('date.not.found')
+            return
+        count = self.calendar_engine.weekdays(now_local().date(), target,
+                                              weekday)
+        self.speak_dialog('weekdays.until', {
+            'count': abs(count),
+            'weekday': said,
+            'date': self._nice_date(target)})
+
+    def _find_weekday(self, text):
+        """Number of the weekday named in text ("mondays"), 0 is Monday."""
+        text = text.lower().strip()
+        weekdays = self._calendar_names()[0] or [
+            datetime.date(2017, 1, day).strftime("%A")
+            for day in range(2, 9)]  # 2017-01-02 was a Monday
+        for number, name in enumerate(weekdays):
+            if text.startswith(name.lower()):
+                return number
+        return None
+
+    def _extract_target_date(self, text):
+        """The next date named by text: a holiday, a month or a date.
+
+        Returns:
+            datetime.date: None if text names no date
+        """
+        text = text.lower().strip()
+        if not text:
+            return None
+        today = now_local().date()
+        for year in (today.year, today.year + 1):
+            holiday = self.holiday_index.find(text, year)
+            if holiday and holiday[1] >= today:
+                return holiday[1]
+
+        # a month means its first day, "how many mondays until june"
+        months = self._calendar_names()[1] or {}
+        for number, name in months.items():
+            if text == name.lower():
+                year = today.year if number > today.month else today.year + 1
+                return datetime.date(year, number, 1)
+
+        try:
+            extract = self._extract_datetime(text)
+        except Exception:
+            return None
+        return extract[0].date() if extract else None
 
     def show_date(self, location, day=None):
         if self.platform == "mycroft_mark_1":
@@ -622,26 +1331,41 @@ class TimeSkill(MycroftSkill):
         self.enclosure.deactivate_mouth_events()
         self.enclosure.mouth_text(show)
 
+    def _calendar_names(self):
+        """Localized (weekday list, {month number: name}) for self.lang.
+
+        Built once per language, None entries mean the language has no
+        date_time_format config and strftime names are used instead.
+        """
+        names = self._calendar_name_cache.get(self.lang)
+        if names is None:
+            if self.lang in date_time_format.lang_config.keys():
+                config = date_time_format.lang_config[self.lang]
+                names = ([day.capitalize()
+                          for day in config['weekday'].values()],
+                         {int(number): month.capitalize()
+                          for number, month in config['month'].items()})
+            else:
+                names = (None, None)
+            self._calendar_name_cache[self.lang] = names
+        return names
+
     def get_weekday(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        if self.lang in date_time_format.lang_config.keys():
-            localized_day_names = list(
-                 date_time_format.lang_config[self.lang]['weekday'].values())
-            weekday = localized_day_names[day.weekday()]
-        else:
-            weekday = day.strftime("%A")
-        return weekday.capitalize()
+        weekdays = self._calendar_names()[0]
+        if weekdays:
+            return weekdays[day.weekday()]
+        return day.strftime("%A").capitalize()
 
     def get_month_date(self, day=None, location=None):
         if not day:
             day = self.get_local_datetime(location)
-        if self.lang in date_time_format.lang_config.keys():
-            localized_month_names = date_time_format.lang_config[self.lang]['month']
-            month = localized_month_names[str(int(day.strftime("%m")))]
+        months = self._calendar_names()[1]
+        if months:
+            month = months[day.month]
         else:
-            month = day.strftime("%B")
-        month = month.capitalize()
+            month = day.strftime("%B").capitalize()
         if self.config_core.get('date_format') == 'MDY':
             return "{} {}".format(month, day.strftime("%d"))
         else:
@@ -653,28 +1377,27 @@ class TimeSkill(MycroftSkill):
         return day.strftime("%Y")
 
     def get_next_leap_year(self, year):
-        next_year = year + 1
-        if self.is_leap_year(next_year):
-            return next_year
-        else:
-            return self.get_next_leap_year(next_year)
+        return next_leap_year(year)
 
     def is_leap_year(self, year):
-        return (year % 400 == 0) or ((year % 4 == 0) and (year % 100 != 0))
+        return is_leap_year(year)
 
     def show_date_gui(self, location, day):
-        self.gui.clear()
-        self.gui['date_string'] = self.get_display_date(day, location)
-        self.gui['weekday_string'] = self.get_weekday(day, location)
+        self.gui_session.clear()
+        self.gui_session['date_string'] = self.get_display_date(day, location)
+        self.gui_session['weekday_string'] = self.get_weekday(day, location)
         month_string = self.get_month_date(day, location).split(" ")
         if self.config_core.get('date_format') == 'MDY':
-            self.gui['day_string'] = month_string[1]
-            self.gui['month_string'] = month_string[0]
+            self.gui_session['day_string'] = month_string[1]
+            self.gui_session['month_string'] = month_string[0]
         else:
-            self.gui['day_string'] = month_string[0]
-            self.gui['month_string'] = month_string[1]
-        self.gui['year_string'] = self.get_year(day, location)
-        self.gui.show_page('date.qml')
+            self.gui_session['day_string'] = month_string[0]
+            self.gui_session['month_string'] = month_string[1]
+        self.gui_session['year_string'] = self.get_year(day, location)
+        self.gui_session.show_page('date.qml')
+
+
+_IMPORT_MS = (time.monotonic() - _IMPORT_STARTED) * 1000
 
 
 def create_skill():
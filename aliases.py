@@ -0,0 +1,230 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Timezone aliases of every language, compiled into one table.
+
+The table merges the translated dialog/<lang>/timezone.value files, the
+IANA zone names in the spellings people say and common abbreviations.
+Regenerate the data file after editing a timezone.value file:
+
+    python aliases.py
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from threading import Lock
+
+try:
+    from .resources import parse_value_file
+except ImportError:  # run as a script
+    from resources import parse_value_file
+
+SKILL_DIR = Path(__file__).parent
+ALIAS_FILE = SKILL_DIR / "data" / "timezone_aliases.tsv"
+VALUE_FILES = "dialog/*/timezone.value"
+
+# Aliases valid in every language
+ANY_LANG = "*"
+
+# Abbreviations that name a single zone, ambiguous ones like "IST" are
+# left to the other tiers.
+ABBREVIATIONS = {
+    "akst": "US/Alaska", "akdt": "US/Alaska",
+    "hst": "US/Hawaii",
+    "pst": "US/Pacific", "pdt": "US/Pacific",
+    "mdt": "US/Mountain",
+    "cst": "US/Central", "cdt": "US/Central",
+    "edt": "US/Eastern",
+    "bst": "Europe/London",
+    "cest": "Europe/Paris",
+    "eest": "Europe/Athens",
+    "msk": "Europe/Moscow",
+    "hkt": "Asia/Hong_Kong",
+    "sgt": "Asia/Singapore",
+    "kst": "Asia/Seoul",
+    "jst": "Asia/Tokyo",
+    "awst": "Australia/Perth",
+    "acst": "Australia/Adelaide", "acdt": "Australia/Adelaide",
+    "aest": "Australia/Sydney", "aedt": "Australia/Sydney",
+    "nzst": "Pacific/Auckland", "nzdt": "Pacific/Auckland",
+}
+
+# Zones dropped from the tz database, still used by translations
+RETIRED_ZONES = {
+    "US/Pacific-New": "US/Pacific",
+}
+
+_database = None
+_database_lock = Lock()
+
+
+def normalize_alias(text):
+    return " ".join(text.lower().split())
+
+
+def _zone_spellings(zone):
+    """"America/New_York" as "america/new_york" and "new york america"."""
+    name = zone.lower()
+    spoken = re.sub(r"([a-z])([A-Z])", r"\g<1> \g<2>", zone)
+    spoken = spoken.replace("_", " ").split("/")
+    spoken.reverse()
+    return {name, name.replace("_", " "), normalize_alias(" ".join(spoken))}
+
+
+def _value_file_entries(path, known_zones):
+    """(alias, zone) rows of a timezone.value file."""
+    for alias, zone in parse_value_file(str(path)).items():
+        zone = RETIRED_ZONES.get(zone, zone)
+        if known_zones is None or zone in known_zones:
+            yield normalize_alias(alias), zone
+
+
+def _known_zones():
+    """Zone names of the installed pytz, None without pytz."""
+    try:
+        import pytz
+        return set(pytz.all_timezones)
+    except ImportError:
+        return None
+
+
+def _without_unknown_zones(entries, zones):
+    """Drop the aliases of zones the installed pytz doesn't have."""
+    if zones is None:
+        return entries
+    return {key: zone for key, zone in entries.items() if zone in zones}
+
+
+def compile_aliases(skill_dir=SKILL_DIR):
+    """Collect the aliases of all languages.
+
+    Returns:
+        Dict: {(lang, alias): zone name}, lang is ANY_LANG for aliases
+              that aren't translations
+    """
+    zones = _known_zones()
+    entries = {}
+    for zone in sorted(zones or ()):
+        for alias in _zone_spellings(zone):
+            entries.setdefault((ANY_LANG, alias), zone)
+    for alias, zone in ABBREVIATIONS.items():
+        entries[(ANY_LANG, alias)] = zone
+    for path in sorted(Path(skill_dir).glob(VALUE_FILES)):
+        lang = path.parent.name
+        for alias, zone in _value_file_entries(path, zones):
+            entries[(lang, alias)] = zone
+    return _without_unknown_zones(entries, zones)
+
+
+def sources_hash(skill_dir=SKILL_DIR):
+    """Hash of the timezone.value files the table is compiled from."""
+    digest = hashlib.sha1()
+    for path in sorted(Path(skill_dir).glob(VALUE_FILES)):
+        digest.update(path.parent.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def write_aliases(entries, path=ALIAS_FILE, skill_dir=SKILL_DIR):
+    with open(str(path), "w", encoding="utf-8") as f:
+        f.write("# Generated by aliases.py, do not edit.\n")
+        f.write("# sources: {}\n".format(sources_hash(skill_dir)))
+        f.write("# alias\tlanguage\tzone\n")
+        for (lang, alias), zone in sorted(entries.items(),
+                                          key=lambda e: (e[0][1], e[0][0])):
+            f.write("{}\t{}\t{}\n".format(alias, lang, zone))
+
+
+def read_aliases(path=ALIAS_FILE):
+    entries = {}
+    with open(str(path), encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            alias, lang, zone = line.rstrip("\n").split("\t")
+            entries[(lang, alias)] = zone
+    return entries
+
+
+class AliasDatabase:
+    """Alias to zone name lookups across languages.
+
+    An alias of the asked language wins, then one every language agrees
+    on, e.g. "China" in any language or "Europe/Paris".
+    """
+
+    def __init__(self, entries):
+        self._by_lang = {}
+        shared = {}
+        conflicts = set()
+        for (lang, alias), zone in entries.items():
+            if lang == ANY_LANG:
+                continue
+            self._by_lang[(lang, alias)] = zone
+            if shared.setdefault(alias, zone) != zone:
+                conflicts.add(alias)
+        for alias in conflicts:
+            del shared[alias]
+        for (lang, alias), zone in entries.items():
+            if lang == ANY_LANG:
+                shared[alias] = zone
+        self._shared = shared
+
+    def lookup(self, alias, lang):
+        """Get the zone name of an alias, None if unknown."""
+        alias = normalize_alias(alias)
+        return (self._by_lang.get((lang.lower(), alias)) or
+                self._shared.get(alias))
+
+    def __len__(self):
+        return len(self._by_lang) + len(self._shared)
+
+
+def _is_stale(path, skill_dir):
+    """True if the value files changed since the table was generated.
+
+    Compares content hashes, checkouts don't keep modification times.
+    """
+    try:
+        with open(str(path), encoding="utf-8") as f:
+            header = [next(f, ""), next(f, "")]
+    except OSError:
+        return True
+    return "# sources: {}\n".format(sources_hash(skill_dir)) not in header
+
+
+def get_alias_database():
+    """Process wide AliasDatabase, loaded on first use.
+
+    Translations edited since the data file was generated are compiled
+    on the fly.  Aliases of zones the installed pytz doesn't know are
+    left out.
+    """
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                if _is_stale(ALIAS_FILE, SKILL_DIR):
+                    entries = compile_aliases()
+                else:
+                    entries = _without_unknown_zones(read_aliases(),
+                                                     _known_zones())
+                _database = AliasDatabase(entries)
+    return _database
+
+
+if __name__ == "__main__":
+    compiled = compile_aliases()
+    write_aliases(compiled)
+    print("{} aliases written to {}".format(len(compiled), ALIAS_FILE))
@@ -0,0 +1,125 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from mycroft.util.parse import extract_number, normalize
+
+_MISSING = object()
+
+
+class UtteranceAnalysis:
+    """Everything the handlers read from one utterance.
+
+    Each part is parsed the first time a handler asks for it and then
+    kept, so handlers delegating to each other share the work.  The
+    datetimes are relative to the time the analysis was made.
+    """
+
+    __slots__ = ("utterance", "text", "_skill", "_extract", "_date_error",
+                 "_future_extract", "_number", "_location",
+                 "_date_location", "_future_location", "_today")
+
+    def __init__(self, utterance, skill):
+        self.utterance = utterance
+        self.text = utterance.lower()
+        self._skill = skill
+        self._extract = _MISSING
+        self._date_error = False
+        self._future_extract = _MISSING
+        self._number = _MISSING
+        self._location = _MISSING
+        self._date_location = _MISSING
+        self._future_location = _MISSING
+        self._today = _MISSING
+
+    @property
+    def extract(self):
+        """extract_datetime() of the lowercase utterance.
+
+        Returns:
+            tuple: (datetime, remainder), None if there is no date or it
+                   couldn't be parsed, see date_error
+        """
+        if self._extract is _MISSING:
+            try:
+                self._extract = self._skill._extract_datetime(self.text)
+            except Exception:
+                self._extract = None
+                self._date_error = True
+        return self._extract
+
+    @property
+    def date_error(self):
+        """True if parsing the date failed."""
+        self.extract
+        return self._date_error
+
+    @property
+    def future_extract(self):
+        """extract_datetime() of the normalized utterance, as used for
+        "what time will it be in 5 hours".
+        """
+        if self._future_extract is _MISSING:
+            self._future_extract = self._skill._extract_datetime(
+                normalize(self.text))
+        return self._future_extract
+
+    @property
+    def number(self):
+        if self._number is _MISSING:
+            self._number = extract_number(self.text)
+        return self._number
+
+    @property
+    def year(self):
+        """The year mentioned, None if no number looks like a year."""
+        year = self.number
+        if not year or year < 1500 or year > 3000:  # filter out non-years
+            return None
+        return year
+
+    @property
+    def location(self):
+        if self._location is _MISSING:
+            self._location = self._skill._extract_location(self.utterance)
+        return self._location
+
+    @property
+    def date_location(self):
+        """The location left once the date has been removed, so "in 3
+        hours" isn't taken for a place.
+        """
+        if self._date_location is _MISSING:
+            extract = self.extract
+            self._date_location = (
+                self._skill._extract_location(extract[1]) if extract
+                else self.location)
+        return self._date_location
+
+    @property
+    def future_location(self):
+        """The location left once the future time has been removed."""
+        if self._future_location is _MISSING:
+            extract = self.future_extract
+            self._future_location = (
+                self._skill._extract_location(extract[1]) if extract
+                else None)
+        return self._future_location
+
+    @property
+    def today(self):
+        """True if the utterance asks about today."""
+        if self._today is _MISSING:
+            self._today = bool(self._skill.voc_match(self.utterance,
+                                                     'Today'))
+        return self._today
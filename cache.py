@@ -0,0 +1,186 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
+from threading import Lock
+
+
+class LRUCache:
+    """Bounded mapping with least-recently-used eviction.
+
+    Lookups are counted so the owner can report how effective the
+    cache is.  All operations are guarded by a lock, the skill calls
+    into caches from both the scheduler and intent handler threads.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """Change the bound, evicting the oldest entries if needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def items(self):
+        """Snapshot of the entries, least recently used first."""
+        with self._lock:
+            return list(self._data.items())
+
+    def stats(self):
+        """Counters as a Dict, suitable for logging."""
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._data), "maxsize": self.maxsize}
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+Resolution = namedtuple("Resolution", ["zone", "tier", "stamp"])
+
+
+class ResolutionCache:
+    """Remembers how location strings were resolved to timezones.
+
+    Entries are keyed by the normalized location and language and hold
+    the IANA zone name together with the tier that produced it.  Failed
+    lookups are stored as well (zone None) with a shorter lifetime so
+    unknown locations don't repeat the network and fuzzy work each time.
+
+    The cache can be written to and restored from a JSON file so a
+    restarted skill starts warm.
+    """
+
+    def __init__(self, maxsize=512, ttl=7 * 86400, negative_ttl=3600):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = LRUCache(maxsize)
+        self.dirty = False
+
+    @staticmethod
+    def key(locale, lang):
+        return "{}|{}".format(lang, " ".join(locale.lower().split()))
+
+    def _expired(self, entry, now):
+        ttl = self.ttl if entry.zone else self.negative_ttl
+        return now - entry.stamp > ttl
+
+    def get(self, locale, lang):
+        """Get a cached Resolution, None if the location isn't known."""
+        key = self.key(locale, lang)
+        entry = self._entries.get(key)
+        if entry and self._expired(entry, time.time()):
+            self._entries.pop(key)
+            self.dirty = True
+            return None
+        return entry
+
+    def put(self, locale, lang, zone, tier=None):
+        """Store a result, zone None records a failed lookup."""
+        entry = Resolution(zone, tier, time.time())
+        self._entries.put(self.key(locale, lang), entry)
+        self.dirty = True
+
+    def clear(self):
+        self._entries.clear()
+        self.dirty = True
+
+    def stats(self):
+        return self._entries.stats()
+
+    def save(self, path):
+        now = time.time()
+        data = {key: list(entry) for key, entry in self._entries.items()
+                if not self._expired(entry, now)}
+        with open(path, "w") as f:
+            json.dump(data, f)
+        self.dirty = False
+
+    def load(self, path):
+        with open(path) as f:
+            data = json.load(f)
+        now = time.time()
+        for key, value in data.items():
+            entry = Resolution(*value)
+            if not self._expired(entry, now):
+                self._entries.put(key, entry)
+        self.dirty = False
+
+
+class SingleFlight:
+    """Runs one call per key at a time.
+
+    Callers asking for a key that is already being computed wait for
+    that call and share its result instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = Lock()
+
+    def run(self, key, func, *args, **kwargs):
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = self._calls[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,132 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+from .cache import LRUCache
+
+WORKING_WEEK = "1111100"  # Monday to Friday
+
+
+def is_leap_year(year):
+    return (year % 400 == 0) or ((year % 4 == 0) and (year % 100 != 0))
+
+
+def next_leap_year(year):
+    """The first leap year after year."""
+    candidate = year + 4 - year % 4
+    if candidate % 100 == 0 and candidate % 400 != 0:
+        # 2100, 2200 and 2300 are skipped
+        candidate += 4
+    return candidate
+
+
+def _as_date(day):
+    if isinstance(day, datetime.datetime):
+        return day.date()
+    return day
+
+
+class CalendarEngine:
+    """Counts of days between dates using NumPy business-day arithmetic.
+
+    Holidays come from a HolidayIndex.  The NumPy calendar for a range of
+    years is built once and kept in a small LRU.  The methods take single
+    dates or sequences of them, sequences are computed in one vectorized
+    call.
+    """
+
+    def __init__(self, holiday_index, weekmask=WORKING_WEEK, max_calendars=8):
+        self.holiday_index = holiday_index
+        self.weekmask = weekmask
+        self._calendars = LRUCache(max_calendars)
+
+    def _calendar(self, first_year, last_year):
+        # imported on first use, it is slow to load
+        import numpy
+        key = (first_year, last_year)
+        calendar = self._calendars.get(key)
+        if calendar is None:
+            days_off = [day for year in range(first_year, last_year + 1)
+                        for day in self.holiday_index.days_off(year)]
+            calendar = numpy.busdaycalendar(
+                weekmask=self.weekmask,
+                holidays=numpy.array(days_off, dtype="datetime64[D]"))
+            self._calendars.put(key, calendar)
+        return calendar
+
+    def _calendar_for(self, *dates):
+        """The calendar covering all years of dates."""
+        import numpy
+        years = numpy.concatenate([numpy.atleast_1d(d) for d in dates])
+        years = years.astype("datetime64[Y]").astype(int) + 1970
+        return self._calendar(int(years.min()), int(years.max()))
+
+    @staticmethod
+    def _dates(days):
+        import numpy
+        if isinstance(days, (list, tuple)):
+            days = [_as_date(day) for day in days]
+        else:
+            days = _as_date(days)
+        return numpy.array(days, dtype="datetime64[D]")
+
+    @staticmethod
+    def _result(values):
+        # plain Python values, datetime64 days become dates
+        import numpy
+        values = numpy.asarray(values)
+        if values.dtype.kind == "M":
+            values = values.astype(object)
+        return values.tolist() if values.ndim else values.item()
+
+    def working_days(self, start, end):
+        """Working days from start up to, but not including, end.
+
+        Returns:
+            int or list: negative when end is before start
+        """
+        import numpy
+        start, end = self._dates(start), self._dates(end)
+        return self._result(numpy.busday_count(
+            start, end, busdaycal=self._calendar_for(start, end)))
+
+    def weekdays(self, start, end, weekday):
+        """How often a weekday (0 is Monday) occurs from start until end.
+
+        Holidays are counted too, "how many Mondays" means all of them.
+        """
+        import numpy
+        mask = ["0"] * 7
+        mask[weekday] = "1"
+        start, end = self._dates(start), self._dates(end)
+        return self._result(numpy.busday_count(start, end,
+                                               weekmask="".join(mask)))
+
+    def add_working_days(self, start, count):
+        """The date count working days after (or before) start.
+
+        A start on a day off counts from the next working day.
+        """
+        import numpy
+        start = self._dates(start)
+        # a year has more than 200 working days
+        span = (numpy.abs(numpy.asarray(count)) // 200 + 1) * 366
+        span = numpy.timedelta64(int(numpy.max(span)), "D")
+        calendar = self._calendar_for(start - span, start + span)
+        return self._result(numpy.busday_offset(start, count, roll="forward",
+                                                busdaycal=calendar))
+
+    def stats(self):
+        return self._calendars.stats()
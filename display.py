@@ -0,0 +1,159 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import deque
+
+from .cache import LRUCache
+
+_MISSING = object()
+
+# Map characters to the display encoding for a Mark 1
+# (4x8 except colon, which is 2x8)
+MARK1_GLYPHS = {
+    ':': 'CIICAA',
+    '0': 'EIMHEEMHAA',
+    '1': 'EIIEMHAEAA',
+    '2': 'EIEHEFMFAA',
+    '3': 'EIEFEFMHAA',
+    '4': 'EIMBABMHAA',
+    '5': 'EIMFEFEHAA',
+    '6': 'EIMHEFEHAA',
+    '7': 'EIEAEAMHAA',
+    '8': 'EIMHEFMHAA',
+    '9': 'EIMBEBMHAA',
+}
+MARK1_WIDTH = 32
+MARK1_ALARM_DOT = (30, 'CA')  # column and code of the alarm indicator
+
+# Every minute of the day, with and without the alarm dot
+mark1_frame_cache = LRUCache(maxsize=1440 * 2)
+
+
+class DisplaySnapshot:
+    """The strings shown by one display update.
+
+    All of them are formatted from the same local datetime, so they
+    agree with each other even when an update straddles a minute.
+    """
+
+    __slots__ = ("dt", "time_string", "date_string", "weekday_string",
+                 "month_string", "year_string")
+
+    def __init__(self, dt, time_string, date_string, weekday_string,
+                 month_string, year_string):
+        self.dt = dt
+        self.time_string = time_string
+        self.date_string = date_string
+        self.weekday_string = weekday_string
+        self.month_string = month_string
+        self.year_string = year_string
+
+
+class GUISession:
+    """Wraps a SkillGUI, only sending values and pages that changed.
+
+    Every value set on a SkillGUI re-sends the whole session over the
+    bus, and clear() plus show_page() makes the GUI rebuild the page.
+    This wrapper has the same clear/set/show_page usage, but values set
+    after clear() are held back until show_page(); if that page is
+    already showing only the changed values are sent.
+
+    Call invalidate() when another skill may have replaced the page.
+    """
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.page = None
+        self._values = {}
+        self._pending = None
+        self._sent = deque()
+
+    def __setitem__(self, key, value):
+        if self._pending is not None:
+            self._pending[key] = value
+        elif self._values.get(key, _MISSING) != value:
+            self._send(key, value)
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def _send(self, key, value):
+        self._values[key] = value
+        self.gui[key] = value
+        self._count()
+
+    def _count(self):
+        self._sent.append(time.monotonic())
+
+    def clear(self):
+        self._pending = {}
+
+    def show_page(self, page):
+        pending = self._pending or {}
+        self._pending = None
+        if page != self.page:
+            self.gui.clear()
+            self._count()
+            self._values = {}
+            self.page = None
+        for key, value in pending.items():
+            self[key] = value
+        if page != self.page:
+            self.gui.show_page(page)
+            self._count()
+            self.page = page
+
+    def invalidate(self):
+        self.page = None
+
+    def messages_per_minute(self):
+        """Number of GUI messages sent during the last minute."""
+        cutoff = time.monotonic() - 60
+        while self._sent and self._sent[0] < cutoff:
+            self._sent.popleft()
+        return len(self._sent)
+
+
+def render_mark1_frame(display_time, alarm_set=False):
+    """Compose the clock as one full width Mark 1 mouth image.
+
+    Images are encoded as two characters for the width and height
+    followed by two characters per column, each holding four rows.
+
+    Returns:
+        str: img_code for enclosure.mouth_display()
+    """
+    key = (display_time, alarm_set)
+    frame = mark1_frame_cache.get(key)
+    if frame:
+        return frame
+
+    columns = ['AA'] * MARK1_WIDTH
+    # draw the time, centered on display
+    x = (MARK1_WIDTH - (4 * len(display_time) - 2)) // 2
+    for c in display_time:
+        glyph = MARK1_GLYPHS.get(c)
+        if glyph:
+            for i in range(2, len(glyph), 2):
+                if 0 <= x < MARK1_WIDTH:
+                    columns[x] = glyph[i:i + 2]
+                x += 1
+    if alarm_set:
+        # Show a dot in the upper-right
+        columns[MARK1_ALARM_DOT[0]] = MARK1_ALARM_DOT[1]
+
+    frame = chr(ord('A') + MARK1_WIDTH) + 'I' + ''.join(columns)
+    mark1_frame_cache.put(key, frame)
+    return frame
@@ -0,0 +1,97 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_left
+from collections import namedtuple
+from pathlib import Path
+from threading import Lock
+
+GAZETTEER_FILE = Path(__file__).parent / "data" / "cities.tsv"
+
+Place = namedtuple("Place", ["name", "lat", "lng", "zone", "regions"])
+
+_gazetteer = None
+_gazetteer_lock = Lock()
+
+
+def normalize_place(text):
+    return " ".join(text.lower().split())
+
+
+class Gazetteer:
+    """Offline index of city names and aliases.
+
+    The data file holds one "name, latitude, longitude, timezone, regions"
+    row per tab separated line, sorted by name, so lookups are binary
+    searches.  Regions are the qualifiers the name may be given with.
+    """
+
+    def __init__(self, path=GAZETTEER_FILE):
+        self.names = []
+        self.places = []
+        with open(str(path), encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                name, lat, lng, zone, regions = line.rstrip("\n").split("\t")
+                regions = frozenset(regions.split(",")) - {""}
+                self.names.append(name)
+                self.places.append(Place(name, float(lat), float(lng), zone,
+                                         regions))
+
+    def get(self, name):
+        """Get the Place with exactly this name, None if unknown."""
+        name = normalize_place(name)
+        i = bisect_left(self.names, name)
+        if i < len(self.names) and self.names[i] == name:
+            return self.places[i]
+        return None
+
+    def find(self, text):
+        """Get the Place named by text, e.g. "Paris" or "Paris, France".
+
+        Qualifiers after a comma must be regions of the place, "Paris,
+        Texas" is not found so the geocoder can look it up.  Spoken
+        qualifiers such as "portland maine" are not stripped, they may
+        name another place.
+        """
+        place = self.get(text)
+        if place:
+            return place
+        name, *qualifiers = text.split(",")
+        place = self.get(name)
+        qualifiers = [normalize_place(q) for q in qualifiers]
+        if place and all(q in place.regions for q in qualifiers if q):
+            return place
+        return None
+
+    def starting_with(self, prefix):
+        """All Places whose name starts with prefix, in name order."""
+        prefix = normalize_place(prefix)
+        i = bisect_left(self.names, prefix)
+        matches = []
+        while i < len(self.names) and self.names[i].startswith(prefix):
+            matches.append(self.places[i])
+            i += 1
+        return matches
+
+
+def get_gazetteer():
+    """Process wide Gazetteer, loaded on first use."""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer()
+    return _gazetteer
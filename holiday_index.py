@@ -0,0 +1,167 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+
+from .cache import LRUCache
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton finding many phrases in one pass over a text.
+
+    Phrases are identified by their position in the list passed in.
+    """
+
+    def __init__(self, phrases):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for phrase_id, phrase in enumerate(phrases):
+            self._add(phrase, phrase_id)
+        self._link()
+
+    def _add(self, phrase, phrase_id):
+        state = 0
+        for char in phrase:
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        self.output[state].append(phrase_id)
+
+    def _link(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = (self.output[child] +
+                                      self.output[self.fail[child]])
+
+    def search(self, text):
+        """Ids of all phrases occurring in text."""
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            found.update(self.output[state])
+        return found
+
+
+def is_known_country(country):
+    """True if the holidays package has a class for this country code."""
+    import holidays
+    cls = getattr(holidays, country, None)
+    return (isinstance(cls, type) and cls is not holidays.HolidayBase and
+            issubclass(cls, holidays.HolidayBase))
+
+
+class HolidayIndex:
+    """Holidays of one country per year, matched against utterances.
+
+    Without a subdivision the holidays of every state or province are
+    merged, the first date seen for a name is kept.  Built years are
+    kept in a bounded LRU.
+    """
+
+    def __init__(self, country="US", subdivision=None, max_years=8):
+        self.country = country
+        self.subdivision = subdivision
+        self._years = LRUCache(max_years)
+        self._days_off = LRUCache(max_years)
+
+    def _country_class(self):
+        # imported on first use, it is slow to load and rarely needed
+        import holidays
+        return getattr(holidays, self.country)
+
+    def _subdivisions(self):
+        if self.subdivision:
+            return [self.subdivision]
+        cls = self._country_class()
+        return (getattr(cls, "STATES", None) or
+                getattr(cls, "PROVINCES", None) or [None])
+
+    def _holidays(self, year, subdivision):
+        """The holidays of one year and subdivision, None meaning national.
+
+        The subdivision is only passed when set, some country classes
+        (e.g. GB) fail on state=None.
+        """
+        cls = self._country_class()
+        if not subdivision:
+            return cls(years=[year])
+        if getattr(cls, "STATES", None):
+            return cls(years=[year], state=subdivision)
+        return cls(years=[year], prov=subdivision)
+
+    def _build(self, year):
+        all_holidays = {}
+        for sub in self._subdivisions():
+            holiday_dict = self._holidays(year, sub)
+            for d, name in holiday_dict.items():
+                if name not in all_holidays:
+                    all_holidays[name] = d
+        names = list(all_holidays)
+        phrases = [name.replace(" Day", "").lower() for name in names]
+        return names, all_holidays, PhraseMatcher(phrases)
+
+    def days_off(self, year):
+        """Dates of the public holidays of a year, sorted.
+
+        Unlike dates(), only holidays of the subdivision are included, or
+        the national ones when there is no subdivision.
+        """
+        days = self._days_off.get(year)
+        if days is None:
+            days = sorted(self._holidays(year, self.subdivision))
+            self._days_off.put(year, days)
+        return days
+
+    def dates(self, year):
+        """All holidays of a year as a {name: date} Dict."""
+        return self._year(year)[1]
+
+    def _year(self, year):
+        entry = self._years.get(year)
+        if entry is None:
+            entry = self._build(year)
+            self._years.put(year, entry)
+        return entry
+
+    def find(self, utt, year):
+        """Find the holiday mentioned in an utterance.
+
+        Returns:
+            tuple: (name, date) of the first listed holiday found in the
+                   lowercase utterance, None if there is none
+        """
+        names, dates, matcher = self._year(year)
+        found = matcher.search(utt)
+        if not found:
+            return None
+        name = names[min(found)]
+        return name, dates[name]
+
+    def stats(self):
+        return self._years.stats()
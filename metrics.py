@@ -0,0 +1,127 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+
+
+def resident_memory():
+    """Resident set size of this process in KB, None if unknown."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+class RollingStat:
+    """The most recent samples of one measurement."""
+
+    def __init__(self, window=200):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value):
+        self.samples.append(value)
+        self.count += 1
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"count": 0}
+
+        def percentile(pct):
+            return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+        return {"count": self.count,
+                "p50_ms": round(percentile(0.5), 3),
+                "p95_ms": round(percentile(0.95), 3),
+                "max_ms": round(ordered[-1], 3)}
+
+
+class Metrics:
+    """Opt-in timing of the skill's slow paths.
+
+    Stages are timed with the timer() context manager, which does
+    nothing while the metrics are disabled.  Caches are registered with
+    a function returning their stats() Dict so hit ratios can be
+    reported alongside the timings.  Memory snapshots and load times are
+    always kept, they are rare and cheap.
+    """
+
+    def __init__(self, window=200):
+        self.enabled = False
+        self.window = window
+        self._stages = {}
+        self._caches = {}
+        self._memory = {}
+        self._load = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def timer(self, stage):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, (time.perf_counter() - start) * 1000)
+
+    def record(self, stage, elapsed_ms):
+        if not self.enabled:
+            return
+        with self._lock:
+            if stage not in self._stages:
+                self._stages[stage] = RollingStat(self.window)
+            self._stages[stage].add(elapsed_ms)
+
+    def record_memory(self, label):
+        """Note the resident memory at a point in time, in KB."""
+        rss = resident_memory()
+        self._memory[label] = rss
+        return rss
+
+    def record_load(self, stage, elapsed_ms):
+        """Note how long a one-off stage of loading the skill took."""
+        self._load[stage] = elapsed_ms
+
+    def add_cache(self, name, get_stats):
+        self._caches[name] = get_stats
+
+    def report(self):
+        """All timings and cache counters as a Dict."""
+        with self._lock:
+            stages = {name: stat.summary()
+                      for name, stat in self._stages.items()}
+        caches = {}
+        for name, get_stats in self._caches.items():
+            stats = dict(get_stats())
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            stats["hit_ratio"] = (round(stats.get("hits", 0) / lookups, 3)
+                                  if lookups else None)
+            caches[name] = stats
+        memory = dict(self._memory, current=resident_memory())
+        return {"stages": stages, "caches": caches, "memory_kb": memory,
+                "load_ms": dict(self._load)}
+
+    def clear(self):
+        with self._lock:
+            self._stages.clear()
@@ -0,0 +1,82 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import json
+import os
+import re
+from threading import Lock
+
+
+def parse_regex_file(path):
+    """Compile the patterns of a .rx file, skipping comments."""
+    patterns = []
+    with open(path) as f:
+        for pat in f.read().splitlines():
+            pat = pat.strip()
+            if pat and pat[0] != "#":
+                patterns.append(re.compile(pat))
+    return patterns
+
+
+def parse_value_file(path, delim=","):
+    """Parse a .value file into a Dict keyed by the lowercase name."""
+    values = {}
+    with open(path) as f:
+        for row in csv.reader(f, delimiter=delim):
+            if len(row) != 2 or row[0].startswith("#"):
+                continue
+            values[row[0].strip().lower()] = row[1].strip()
+    return values
+
+
+def parse_json_file(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+class ResourceCache:
+    """Parsed files, reloaded only when their modification time changes.
+
+    Each file is kept per parser, so the same file can be cached both
+    raw and compiled.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+
+    def load(self, path, parser, default=None):
+        """Get the parsed contents of path.
+
+        Returns:
+            the parser result, default if the file doesn't exist
+        """
+        key = (str(path), parser)
+        try:
+            mtime = os.stat(str(path)).st_mtime_ns
+        except OSError:
+            self._entries.pop(key, None)
+            return default
+
+        entry = self._entries.get(key)
+        if entry and entry[0] == mtime:
+            return entry[1]
+        with self._lock:
+            value = parser(str(path))
+            self._entries[key] = (mtime, value)
+        return value
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,394 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Offline latency benchmark for the Date and Time skill.
+
+Runs the intent handlers and each timezone resolution tier against a
+stubbed skill base class, bus, GUI and enclosure, so no running
+mycroft-core is needed.  The network geocoder is replaced by a fake with
+a configurable delay.  Parsing and formatting use mycroft.util when
+mycroft-core is importable and lingua_franca otherwise.
+
+Usage:
+    python test/benchmark/benchmark.py [-n ITERATIONS] [-o results.json]
+
+Results are printed (or written) as JSON so runs can be compared.
+"""
+
+import argparse
+import datetime
+import importlib.util
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parents[2]
+SKILL_ID = "mycroft-date-time.mycroftai"
+
+# Coordinates the fake geocoder knows about
+FAKE_PLACES = {
+    "paris": (48.86, 2.35),
+    "tokyo": (35.68, 139.69),
+    "denver": (39.74, -104.99),
+    "lawrence kansas": (38.97, -95.24),
+}
+
+TIME_UTTERANCES = [
+    "what time is it",
+    "what time is it in paris",
+    "what time is it in lawrence kansas",
+]
+FUTURE_TIME_UTTERANCES = [
+    "what time will it be in 5 hours",
+    "what time will it be in 8 hours in tokyo",
+]
+DATE_UTTERANCES = [
+    "what is the date",
+    "what day is christmas",
+    "what is the date in denver",
+]
+# Holiday countries whose index must build, GB takes no subdivisions
+HOLIDAY_COUNTRIES = ["US", "GB", "CA", "DE"]
+TIMEZONE_LOCATIONS = [
+    "paris",
+    "lawrence kansas",
+    "america/new_york",
+    "east coast",
+    "sydney australia",
+]
+
+
+class FakeBus:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, message):
+        self.emitted.append(message)
+
+    def on(self, msg_type, handler):
+        pass
+
+    def wait_for_response(self, message, reply_type=None, timeout=3.0):
+        return None
+
+
+class FakeGUI(dict):
+    connected = True
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    def clear(self):
+        dict.clear(self)
+
+    def show_page(self, page, override_idle=None):
+        self.pages.append(page)
+
+
+class FakeDisplayManager:
+    def get_active(self):
+        return ''
+
+    def remove_active(self):
+        pass
+
+
+class FakeEnclosure:
+    def __init__(self):
+        self.display_manager = FakeDisplayManager()
+        self.messages = 0
+
+    def __getattr__(self, name):
+        # mouth_display, mouth_reset, mouth_text, ... just count messages
+        def call(*args, **kwargs):
+            self.messages += 1
+        return call
+
+
+class FakeGeocoder:
+    """Stand in for geocoder.osm with a fixed network delay."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+
+    def osm(self, location, timeout=None, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        lat, lng = FAKE_PLACES.get(location.lower(), (None, None))
+        return types.SimpleNamespace(lat=lat, lng=lng, ok=lat is not None)
+
+
+class StubSkill:
+    """The parts of MycroftSkill the Date and Time skill uses."""
+
+    def __init__(self, name=None, bus=None):
+        self.name = name
+        self.skill_id = SKILL_ID
+        self.root_dir = str(SKILL_DIR)
+        self.lang = "en-us"
+        self.location_timezone = "America/Chicago"
+        self.config_core = {"time_format": "half", "date_format": "MDY",
+                            "enclosure": {"platform": "mycroft_mark_1"}}
+        self.settings = {"use_online_geocoder": True}
+        self.settings_change_callback = None
+        self.bus = FakeBus()
+        self.gui = FakeGUI()
+        self.enclosure = FakeEnclosure()
+        self.file_system = types.SimpleNamespace(path=tempfile.mkdtemp())
+        self.log = logging.getLogger(SKILL_ID)
+        self.spoken = []
+        self.events = {}
+
+    def speak_dialog(self, key, data=None, expect_response=False, wait=False):
+        self.spoken.append((key, data))
+
+    def ask_yesno(self, prompt, data=None):
+        return "no"
+
+    def translate(self, text, data=None):
+        path = self.find_resource(text + ".dialog", "dialog")
+        line = Path(path).read_text().splitlines()[0]
+        for key, value in (data or {}).items():
+            line = line.replace("{{" + key + "}}", str(value))
+        return line
+
+    def find_resource(self, res_name, res_dirname=None):
+        path = SKILL_DIR / (res_dirname or "") / self.lang / res_name
+        return str(path) if path.is_file() else None
+
+    def voc_match(self, utt, voc_filename, lang=None, exact=False):
+        path = SKILL_DIR / "vocab" / self.lang / (voc_filename + ".voc")
+        words = [w.strip() for w in path.read_text().splitlines()
+                 if w.strip() and not w.startswith("#")]
+        return any(w in utt.lower() for w in words)
+
+    def add_event(self, name, handler, handler_info=None, once=False):
+        self.events[name] = handler
+
+    def schedule_event(self, handler, when, data=None, name=None,
+                       context=None):
+        self.events[name] = handler
+
+    def schedule_repeating_event(self, handler, when, frequency, data=None,
+                                 name=None, context=None):
+        self.events[name] = handler
+
+    def cancel_scheduled_event(self, name):
+        self.events.pop(name, None)
+
+    def shutdown(self):
+        pass
+
+
+def _identity_decorator(*args, **kwargs):
+    return lambda func: func
+
+
+def install_framework():
+    """Make the skill importable with StubSkill as its base class."""
+    try:
+        import mycroft
+        import mycroft.audio
+        mycroft.audio.is_speaking = lambda: False
+        mycroft.audio.wait_while_speaking = lambda: None
+        mycroft.MycroftSkill = StubSkill
+        return "mycroft"
+    except ImportError:
+        pass
+
+    import lingua_franca
+    import lingua_franca.format
+    import lingua_franca.parse
+    import lingua_franca.time
+    if hasattr(lingua_franca, "load_language"):
+        lingua_franca.load_language("en")
+
+    def module(name, **attrs):
+        mod = types.ModuleType(name)
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, mod)
+        return mod
+
+    module("mycroft", MycroftSkill=StubSkill,
+           intent_handler=_identity_decorator)
+    module("mycroft.audio", is_speaking=lambda: False,
+           wait_while_speaking=lambda: None)
+    module("mycroft.messagebus")
+    module("mycroft.messagebus.message",
+           Message=lambda msg_type, data=None, context=None:
+           types.SimpleNamespace(msg_type=msg_type, data=data or {}))
+    module("mycroft.skills", resting_screen_handler=_identity_decorator)
+    module("mycroft.util")
+    for name in ("format", "parse", "time"):
+        mod = getattr(lingua_franca, name)
+        sys.modules["mycroft.util." + name] = mod
+        setattr(sys.modules["mycroft.util"], name, mod)
+    module("adapt")
+    module("adapt.intent", IntentBuilder=IntentBuilderStub)
+    return "lingua_franca"
+
+
+class IntentBuilderStub:
+    def __init__(self, name):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args: self
+
+
+def load_skill_module():
+    spec = importlib.util.spec_from_file_location(
+        "skill_date_time", str(SKILL_DIR / "__init__.py"),
+        submodule_search_locations=[str(SKILL_DIR)])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(func, iterations, setup=None):
+    """Time func, calling setup (untimed) before every run."""
+    samples = []
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"iterations": iterations,
+            "min_ms": min(samples),
+            "median_ms": statistics.median(samples),
+            "mean_ms": statistics.mean(samples),
+            "max_ms": max(samples)}
+
+
+def message(utterance):
+    return types.SimpleNamespace(data={"utterance": utterance})
+
+
+def benchmark_handlers(skill, iterations):
+    cases = {}
+    for utt in TIME_UTTERANCES:
+        cases["handle_query_time: " + utt] = (
+            skill.handle_query_time, message(utt))
+    for utt in FUTURE_TIME_UTTERANCES:
+        cases["handle_query_future_time: " + utt] = (
+            skill.handle_query_future_time, message(utt))
+    for utt in DATE_UTTERANCES:
+        cases["handle_query_date: " + utt] = (
+            skill.handle_query_date, message(utt))
+    for name in ("handle_date_future_weekend", "handle_date_last_weekend",
+                 "handle_query_next_leap_year"):
+        cases[name] = (getattr(skill, name), message(""))
+
+    results = {}
+    for name, (handler, msg) in cases.items():
+        results[name] = measure(lambda: handler(msg), iterations)
+    return results
+
+
+def benchmark_tiers(skill, iterations):
+    tiers = {
+        "zone_name": skill._get_timezone_from_zone_name,
+        "gazetteer": skill._get_timezone_from_gazetteer,
+        "geocoder": skill._get_timezone_from_geocoder,
+        "table": skill._get_timezone_from_table,
+        "fuzzy": skill._get_timezone_from_fuzzymatch,
+    }
+    results = {}
+    for location in TIMEZONE_LOCATIONS:
+        for tier, lookup in tiers.items():
+            results["{}: {}".format(tier, location)] = measure(
+                lambda: lookup(location), iterations)
+        results["get_timezone cold: " + location] = measure(
+            lambda: skill.get_timezone(location), iterations,
+            setup=skill.resolution_cache.clear)
+        results["get_timezone warm: " + location] = measure(
+            lambda: skill.get_timezone(location), iterations)
+    return results
+
+
+def benchmark_holidays(skill, iterations):
+    """Build the holiday index of each country, failing if one is empty."""
+    results = {}
+    year = datetime.date.today().year
+    for country in HOLIDAY_COUNTRIES:
+        skill.settings["holiday_country"] = country
+        index = skill.holiday_index
+        if index.country != country or not index.dates(year):
+            raise RuntimeError("No holidays for " + country)
+        results["build: " + country] = measure(
+            lambda: index._build(year), iterations)
+        results["find: " + country] = measure(
+            lambda: index.find("what day is christmas", year), iterations)
+    skill.settings.pop("holiday_country")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    parser.add_argument("-o", "--output", help="write JSON to this file")
+    parser.add_argument("--geocoder-delay", type=float, default=0.2,
+                        help="simulated geocoder latency in seconds")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    backend = install_framework()
+
+    # the skill imports geocoder when it first needs it
+    sys.modules["geocoder"] = FakeGeocoder(args.geocoder_delay)
+    start = time.perf_counter()
+    module = load_skill_module()
+    import_ms = (time.perf_counter() - start) * 1000
+
+    skill = module.create_skill()
+    start = time.perf_counter()
+    skill.initialize()
+    initialize_ms = (time.perf_counter() - start) * 1000
+
+    results = {
+        "meta": {
+            "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "backend": backend,
+            "iterations": args.iterations,
+            "geocoder_delay_s": args.geocoder_delay,
+        },
+        "load": {"import_ms": import_ms, "initialize_ms": initialize_ms},
+        "handlers": benchmark_handlers(skill, args.iterations),
+        "timezone_tiers": benchmark_tiers(skill, args.iterations),
+        "holidays": benchmark_holidays(skill, args.iterations),
+    }
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        Path(args.output).write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+# Copyright 2017, Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+from bisect import bisect_right
+from collections import Counter
+from difflib import SequenceMatcher
+from threading import Lock
+
+from .cache import LRUCache
+
+# Coordinates are rounded to this many decimals (~1 km) before lookup
+COORD_PRECISION = 2
+
+_finder = None
+_fuzzy_index = None
+_finder_lock = Lock()
+_MISSING = object()
+
+coordinate_cache = LRUCache(maxsize=1024)
+transition_cache = LRUCache(maxsize=64)
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def get_finder():
+    """Process wide TimezoneFinder, created on first use.
+
+    Building a finder loads the timezone index, so it is only done once
+    and shared by every lookup.  The polygons themselves are read from
+    memory-mapped files, which the OS shares between processes.
+    """
+    global _finder
+    if _finder is None:
+        with _finder_lock:
+            if _finder is None:
+                # imported here, loading it is a noticeable part of startup
+                from timezonefinder import TimezoneFinder
+                _finder = TimezoneFinder(in_memory=False)
+    return _finder
+
+
+def get_zone(name):
+    """pytz timezone for an IANA zone name.
+
+    Raises:
+        pytz.UnknownTimeZoneError: if there is no such zone
+    """
+    import pytz
+    return pytz.timezone(name)
+
+
+def timezone_at(lat, lng):
+    """Get the IANA zone name for a coordinate.
+
+    Returns:
+        str: zone name such as "Europe/Paris", None if the point is
+             not inside any zone (e.g. open sea)
+    """
+    key = (round(lat, COORD_PRECISION), round(lng, COORD_PRECISION))
+    zone = coordinate_cache.get(key, _MISSING)
+    if zone is _MISSING:
+        zone = get_finder().timezone_at(lat=key[0], lng=key[1])
+        coordinate_cache.put(key, zone)
+    return zone
+
+
+def _trigrams(text):
+    padded = "  " + text + " "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _name_variants(name):
+    """Spellings of a zone name a user might say.
+
+    E.g. "America/North_Dakota/Center" gives "north dakota",
+    "north dakota center" and "center north dakota".
+    """
+    parts = name.lower().replace("_", " ").split("/")
+    if len(parts) == 1:
+        return (parts[0],)
+    return (parts[1],
+            parts[-2] + " " + parts[-1],
+            parts[-1] + " " + parts[-2])
+
+
+class FuzzyZoneIndex:
+    """Precomputed index for fuzzy matching locations to pytz zones.
+
+    A trigram inverted index over the name variants of every zone
+    shortlists the closest candidates, which are scored first with
+    SequenceMatcher (the same ratio as mycroft's fuzzy_match).  The
+    remaining variants are then only scored when the cheap upper bounds
+    of the ratio say they could still win, so the result is the same as
+    a full scan.
+    """
+
+    def __init__(self, zones=None, shortlist=20):
+        if zones is None:
+            import pytz
+            zones = pytz.all_timezones
+        self.zones = list(zones)
+        self.shortlist = shortlist
+        # Flat list of (zone id, variant) and the trigrams of each
+        self.variants = []
+        self.grams = []
+        self.index = {}
+        for zone_id, name in enumerate(self.zones):
+            for variant in _name_variants(name):
+                variant_id = len(self.variants)
+                grams = _trigrams(variant)
+                self.variants.append((zone_id, variant))
+                self.grams.append(len(grams))
+                for gram in grams:
+                    self.index.setdefault(gram, []).append(variant_id)
+
+    def candidates(self, target):
+        """Ids of the variants most similar to target by trigrams."""
+        grams = _trigrams(target)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.index.get(gram, ()))
+        # Dice coefficient, like ratio() it is relative to both lengths
+        dice = {variant_id: count / (self.grams[variant_id] + len(grams))
+                for variant_id, count in shared.items()}
+        return sorted(dice, key=dice.get, reverse=True)[:self.shortlist]
+
+    def best_match(self, target):
+        """Find the closest zone name.
+
+        Returns:
+            tuple: (score, zone name), None if there are no zones
+        """
+        if not self.zones:
+            return None
+        matcher = SequenceMatcher(None, "", target)
+        scores = {}
+
+        def ratio(variant_id):
+            if variant_id not in scores:
+                matcher.set_seq1(self.variants[variant_id][1])
+                scores[variant_id] = matcher.ratio()
+            return scores[variant_id]
+
+        threshold = max((ratio(v) for v in self.candidates(target)),
+                        default=0.0)
+
+        zone_scores = [0.0] * len(self.zones)
+        for variant_id, (zone_id, variant) in enumerate(self.variants):
+            if variant_id in scores:
+                score = scores[variant_id]
+            else:
+                # Upper bounds of ratio(), from lengths and then letters
+                total = len(variant) + len(target)
+                if 2.0 * min(len(variant), len(target)) < threshold * total:
+                    continue
+                matcher.set_seq1(variant)
+                if matcher.quick_ratio() < threshold:
+                    continue
+                score = ratio(variant_id)
+            zone_scores[zone_id] = max(zone_scores[zone_id], score)
+
+        # Last of the best, like the original linear scan
+        best = max(zone_scores)
+        for zone_id in range(len(self.zones) - 1, -1, -1):
+            if zone_scores[zone_id] == best:
+                return best, self.zones[zone_id]
+
+
+def get_fuzzy_index():
+    """Process wide FuzzyZoneIndex, built on first use."""
+    global _fuzzy_index
+    if _fuzzy_index is None:
+        with _finder_lock:
+            if _fuzzy_index is None:
+                _fuzzy_index = FuzzyZoneIndex()
+    return _fuzzy_index
+
+
+class ZoneTransitions:
+    """The UTC offsets of a zone over time, for converting UTC times.
+
+    Built once per zone from the transition tables in the pytz data.
+    Conversions bisect the table, so they are correct on either side of
+    a daylight saving change without calling into the tzinfo.
+    """
+
+    def __init__(self, zone):
+        self.zone = zone
+        times = getattr(zone, "_utc_transition_times", None)
+        if times:
+            self.starts = list(times)
+            self.tzinfos = [zone._tzinfos[info]
+                            for info in zone._transition_info]
+            self.offsets = [info[0] for info in zone._transition_info]
+        else:
+            # a fixed offset, like UTC or Etc/GMT+8
+            self.starts = [datetime.datetime.min]
+            self.tzinfos = [zone]
+            self.offsets = [zone.utcoffset(None) or datetime.timedelta(0)]
+        self.start_stamps = [(start - _EPOCH).total_seconds()
+                             for start in self.starts]
+
+    def _index(self, table, value):
+        return max(0, bisect_right(table, value) - 1)
+
+    def convert(self, dt):
+        """Convert an aware datetime to this zone, like astimezone()."""
+        utc = dt.replace(tzinfo=None) - dt.utcoffset()
+        i = self._index(self.starts, utc)
+        return (utc + self.offsets[i]).replace(tzinfo=self.tzinfos[i])
+
+    def localize(self, naive):
+        """Attach this zone to a wall clock time, like pytz's localize().
+
+        A time skipped or repeated by a daylight saving change gets one
+        of the offsets around it.
+        """
+        # the offset in effect at naive read as UTC is at most one
+        # transition away from the right one
+        i = self._index(self.starts, naive)
+        for _ in range(2):
+            j = self._index(self.starts, naive - self.offsets[i])
+            if j == i:
+                break
+            i = j
+        return naive.replace(tzinfo=self.tzinfos[i])
+
+    def utc_offset(self, timestamp):
+        """The offset from UTC as a timedelta at a POSIX timestamp."""
+        return self.offsets[self._index(self.start_stamps, timestamp)]
+
+    def convert_timestamps(self, timestamps):
+        """Local times of many POSIX timestamps at once."""
+        local = []
+        for timestamp in timestamps:
+            i = self._index(self.start_stamps, timestamp)
+            local.append((_EPOCH + datetime.timedelta(seconds=timestamp) +
+                          self.offsets[i]).replace(tzinfo=self.tzinfos[i]))
+        return local
+
+    def transitions(self, start, end):
+        """UTC times of the offset changes between two aware datetimes."""
+        start = start.replace(tzinfo=None) - start.utcoffset()
+        end = end.replace(tzinfo=None) - end.utcoffset()
+        first = bisect_right(self.starts, start)
+        last = bisect_right(self.starts, end)
+        return self.starts[first:last]
+
+
+def get_transitions(zone):
+    """ZoneTransitions of a pytz zone, cached by zone name."""
+    transitions = transition_cache.get(zone.zone)
+    if transitions is None:
+        transitions = ZoneTransitions(zone)
+        transition_cache.put(zone.zone, transitions)
+    return transitions
+
+
+def convert(dt, zone):
+    """dt.astimezone(zone) using the cached transition table."""
+    return get_transitions(zone).convert(dt)
+
+
+def localize(naive, zone):
+    """zone.localize(naive) using the cached transition table."""
+    return get_transitions(zone).localize(naive)